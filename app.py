@@ -5,11 +5,11 @@ from PyQt6.QtGui import QGuiApplication
 from PyQt6.QtWidgets import QApplication
 
 from my_player.ui.main_window import MyPlayerMain
-from my_player.helpers.constants import SONGS_DIR
+from my_player.helpers.constants import ensure_dirs
 
 
 def main():
-    SONGS_DIR.mkdir(parents=True, exist_ok=True)
+    ensure_dirs()
 
     try:
         QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
@@ -17,13 +17,20 @@ SONGS_DIR   = DATA_DIR / "songs"
 
 CACHE_DIR        = APP_ROOT / "data" / "cache"
 STATE_DB         = CACHE_DIR / ".player_state.json"
-DURATION_DB      = CACHE_DIR / ".durations_cache.json"
+DURATION_DB      = CACHE_DIR / ".durations_cache.sqlite"
+LEGACY_DURATION_DB = CACHE_DIR / ".durations_cache.json"  # migrated into DURATION_DB on first open
 HISTORY_DB       = CACHE_DIR / ".listening_history.json"
 CUSTOM_SOURCE_DB = CACHE_DIR / ".custom_sources.json"
+SCAN_CACHE_DB    = CACHE_DIR / ".scan_cache.json"
+LIBRARY_CACHE_DB = CACHE_DIR / ".library_cache.pkl"
+
+
+def ensure_dirs() -> None:
+    """Create the data directories (called from the app entry point, not on import)."""
+    for _d in (DATA_DIR, SONGS_DIR, LIBRARY_DIR, CACHE_DIR):
+        if not _d.is_dir():
+            _d.mkdir(parents=True, exist_ok=True)
 
-# Ensure directories exist
-for _d in (DATA_DIR, SONGS_DIR, LIBRARY_DIR, CACHE_DIR):
-    _d.mkdir(parents=True, exist_ok=True)
 
 # Allowed characters for filenames
 SAFE_CHAR_RE = re.compile(r"[^A-Za-z0-9._\- ]+")
@@ -57,11 +64,32 @@ BAD_SEARCH_KEYWORDS = [
     "teaser","trailer","live","stage","performance","remix","reprise","lofi","cover","cover by",
     "unplugged","karaoke","8d","speed up","slowed","movie","lofi"
 ]
+# One word-bounded, case-insensitive alternation over the (deduped) keywords,
+# so a title is classified in a single regex pass.
+BAD_KW_PATTERN = r"\b(?:" + "|".join(re.escape(k) for k in dict.fromkeys(BAD_SEARCH_KEYWORDS)) + r")\b"
+BAD_KW_RE = re.compile(BAD_KW_PATTERN, re.IGNORECASE)
 
 # song length to be valid for download
 MIN_SEC = 150
 MAX_SEC = 540
 
-# How many rows to populate per timer “batch”
-TABLE_BATCH_SIZE = 10  # how many songs load at a time. Smaller value means better app responsiveness
 PREFETCH_MS = 60_000
+
+# Playback position → seek bar / clock: at most one repaint per interval (~20 fps)
+POSITION_UI_MS = 50
+
+# yt-dlp progress → status bar: at most one cross-thread signal per interval per download
+PROGRESS_EMIT_MS = 200
+
+# Max background download jobs buffered for the workers (the rest wait in a backlog)
+BG_QUEUE_MAX = 512
+
+# Search box debounce; widened after a search that took longer than SLOW_SEARCH_MS
+SEARCH_DEBOUNCE_MS = 220
+SEARCH_DEBOUNCE_SLOW_MS = 400
+SLOW_SEARCH_MS = 150
+
+# Rows of the current view persisted in the state file for the next launch's first paint
+LAST_VIEW_MAX_ROWS = 200
+# Quiet period before a burst of state changes (volume drags) is written out
+STATE_SAVE_DEBOUNCE_MS = 500
@@ -1,11 +1,18 @@
 import csv
+import os
 import re
-from typing import List, Tuple, Any
+from itertools import chain
+from typing import Dict, List, Tuple, Any
 from pathlib import Path
 
 from my_player.models.song import Song
 from my_player.io.library_io import looks_like_header, column_indices, category_csv_path
 
+# Normalized (title, album, artists) comparison key
+RowKey = Tuple[str, str, str]
+
+_ARTIST_SPLIT_RE = re.compile(r"[;/,]")
+
 
 def _coerce_row_like(x: Any) -> Tuple[str, str, str]:
     """
@@ -16,7 +23,7 @@ def _coerce_row_like(x: Any) -> Tuple[str, str, str]:
     Returns (title, album, artists_str)
     """
     if isinstance(x, Song):
-        return x.title, x.album, ", ".join(x.artists)
+        return x.title, x.album, x.artists_str
     if isinstance(x, (tuple, list)) and len(x) >= 3:
         t, a, ar = x[0], x[1], x[2]
         return str(t).strip(), str(a).strip(), str(ar).strip()
@@ -31,65 +38,126 @@ def _coerce_row_like(x: Any) -> Tuple[str, str, str]:
     return str(x).strip(), "", ""
 
 
-def _read_category_rows(category: str) -> Tuple[List[str], List[List[str]], Tuple[int, int, int]]:
+def _read_category_rows(
+    category: str,
+) -> Tuple[List[str], List[List[str]], Tuple[int, int, int], Dict[RowKey, int]]:
     """
-    Return (header_row, rows, (title_ix, album_ix, artists_ix)).
+    Return (header_row, rows, (title_ix, album_ix, artists_ix), row_index).
     header_row is the original header if present (else empty list).
     rows are the body rows (no header).
+    row_index maps each normalized (title, album, artists) key to the index
+    of its first row, for O(1) duplicate lookups.
     """
     p = category_csv_path(category)
     if not p.exists():
-        return ["Title", "Album", "Artists"], [], (0, 1, 2)
+        return ["Title", "Album", "Artists"], [], (0, 1, 2), {}
 
     with p.open("r", encoding="utf-8", newline="") as f:
         reader = csv.reader(f)
         raw = list(reader)
 
     if not raw:
-        return ["Title", "Album", "Artists"], [], (0, 1, 2)
+        return ["Title", "Album", "Artists"], [], (0, 1, 2), {}
 
     first = raw[0]
-    norm_header = [h.strip().lower().replace(" ", "") for h in first]
-    if looks_like_header(norm_header):
+    has_header, indices = _detect_layout(first)
+    if has_header:
         header = first
         body = raw[1:]
-        title_ix, album_ix, artists_ix = column_indices(norm_header, default_len=len(first))
     else:
         header = ["Title", "Album", "Artists"]
         body = raw
-        title_ix, album_ix, artists_ix = column_indices([], default_len=len(first))
 
-    return header, body, (title_ix, album_ix, artists_ix)
+    return header, body, indices, _index_rows(body, indices)
+
+
+def _detect_layout(first: List[str]) -> Tuple[bool, Tuple[int, int, int]]:
+    """Return (has_header, (title_ix, album_ix, artists_ix)) from the first CSV row."""
+    norm_header = [h.strip().lower().replace(" ", "") for h in first]
+    if looks_like_header(norm_header):
+        return True, column_indices(norm_header, default_len=len(first))
+    return False, column_indices([], default_len=len(first))
+
+
+def _row_exists(category: str, needle: Tuple[str, str, str]) -> bool:
+    """
+    Stream the category CSV and return True on the first row equal to
+    needle (title, album, artists). Never materialises the file.
+    """
+    p = category_csv_path(category)
+    if not p.exists():
+        return False
+
+    key = _row_key(*needle)
+    with p.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        first = next(reader, None)
+        if first is None:
+            return False
+
+        has_header, (t_ix, a_ix, ar_ix) = _detect_layout(first)
+        rows = reader if has_header else chain([first], reader)
+        for r in rows:
+            t = r[t_ix] if t_ix < len(r) else ""
+            a = r[a_ix] if a_ix < len(r) else ""
+            ar = r[ar_ix] if ar_ix < len(r) else ""
+            if _row_key(t, a, ar) == key:
+                return True
+    return False
+
+
+def _append_category_row(category: str, row: List[str]) -> Path:
+    """
+    Append a single row to the category CSV without rewriting it.
+    Writes the default header for a new/empty file and repairs a missing
+    trailing newline so the row never glues onto the previous line.
+    """
+    p = category_csv_path(category)
+    p.parent.mkdir(parents=True, exist_ok=True)
+
+    needs_header = not p.exists() or p.stat().st_size == 0
+    needs_newline = False
+    if not needs_header:
+        with p.open("rb") as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) not in (b"\n", b"\r")
+
+    with p.open("a", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        if needs_newline:
+            f.write(w.dialect.lineterminator)
+        if needs_header:
+            w.writerow(["Title", "Album", "Artists"])
+        w.writerow(row)
+    return p
 
 
 def _normalize_artists_str(s: str) -> str:
     # Normalize delimiters and extra spaces for comparison
-    parts = [p.strip() for p in re.split(r"[;/,]", s) if p.strip()]
+    parts = [p.strip() for p in _ARTIST_SPLIT_RE.split(s) if p.strip()]
     return ", ".join(parts)
 
 
-def _rows_equal(lhs: Tuple[str, str, str], rhs: Tuple[str, str, str]) -> bool:
-    lt, la, lar = lhs
-    rt, ra, rar = rhs
-    if lt.strip() != rt.strip():
-        return False
-    if la.strip() != ra.strip():
-        return False
-    return _normalize_artists_str(lar) == _normalize_artists_str(rar)
+def _row_key(title: str, album: str, artists: str) -> RowKey:
+    """Normalized comparison key for a (title, album, artists) row."""
+    return title.strip(), album.strip(), _normalize_artists_str(artists)
 
 
-def _find_row_index(rows: List[List[str]],
-                    indices: Tuple[int, int, int],
-                    needle: Tuple[str, str, str]) -> int:
-    """Find the first row that equals the needle (title, album, artists), else -1."""
+def _index_rows(rows: List[List[str]], indices: Tuple[int, int, int]) -> Dict[RowKey, int]:
+    """Map each row's normalized key to the index of its first occurrence."""
     t_ix, a_ix, ar_ix = indices
+    index: Dict[RowKey, int] = {}
     for i, r in enumerate(rows):
-        t = (r[t_ix] if t_ix < len(r) else "").strip()
-        a = (r[a_ix] if a_ix < len(r) else "").strip()
-        ar = (r[ar_ix] if ar_ix < len(r) else "").strip()
-        if _rows_equal((t, a, ar), needle):
-            return i
-    return -1
+        t = r[t_ix] if t_ix < len(r) else ""
+        a = r[a_ix] if a_ix < len(r) else ""
+        ar = r[ar_ix] if ar_ix < len(r) else ""
+        index.setdefault(_row_key(t, a, ar), i)
+    return index
+
+
+def _find_row_index(index: Dict[RowKey, int], needle: Tuple[str, str, str]) -> int:
+    """Find the first row that equals the needle (title, album, artists), else -1."""
+    return index.get(_row_key(*needle), -1)
 
 
 def _write_category_rows(category: str, header: List[str], rows: List[List[str]]) -> Path:
@@ -110,14 +178,12 @@ def copy_song_to_category(target_category: str, song_like: Any) -> bool:
     Returns True if appended, False if a duplicate already exists.
     """
     t, a, ar = _coerce_row_like(song_like)
-    header_t, rows_t, idx_t = _read_category_rows(target_category)
 
-    # Check duplicate in target
-    if _find_row_index(rows_t, idx_t, (t, a, ar)) != -1:
+    # Check duplicate in target (streamed; stops at the first match)
+    if _row_exists(target_category, (t, a, ar)):
         return False
 
-    rows_t.append([t, a, ar])
-    _write_category_rows(target_category, header_t, rows_t)
+    _append_category_row(target_category, [t, a, ar])
     return True
 
 
@@ -129,16 +195,16 @@ def move_song_between_categories(source_category: str, target_category: str, son
     t, a, ar = _coerce_row_like(song_like)
 
     # Read source
-    header_s, rows_s, idx_s = _read_category_rows(source_category)
-    i = _find_row_index(rows_s, idx_s, (t, a, ar))
+    header_s, rows_s, _, index_s = _read_category_rows(source_category)
+    i = _find_row_index(index_s, (t, a, ar))
     if i == -1:
         return False  # not found in source
 
     # Read target
-    header_t, rows_t, idx_t = _read_category_rows(target_category)
+    header_t, rows_t, _, index_t = _read_category_rows(target_category)
 
     # Duplicate check on target
-    if _find_row_index(rows_t, idx_t, (t, a, ar)) != -1:
+    if _find_row_index(index_t, (t, a, ar)) != -1:
         return False  # already in target
 
     # Move
@@ -1,11 +1,119 @@
-from typing import Dict
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional
 
-from my_player.helpers.constants import DURATION_DB
-from my_player.helpers.json_utils import load_json, save_json
+from my_player.helpers.constants import DURATION_DB, LEGACY_DURATION_DB
+from my_player.helpers.duration_utils import sec_from_cache_val
+from my_player.helpers.json_utils import load_json
+
+# Single shared connection (WAL); guarded by a lock so background threads can use it too.
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+# PRAGMA user_version value meaning "every stored value is already plain seconds",
+# so startup can skip the legacy ms/sec normalisation pass.
+_NORMALIZED = 1
+
+
+def _db() -> sqlite3.Connection:
+    """Open (once) the duration DB, creating the table and migrating legacy JSON."""
+    global _conn
+    if _conn is None:
+        DURATION_DB.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(DURATION_DB), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS d (k TEXT PRIMARY KEY, s INTEGER NOT NULL)")
+
+        # One-time migration from the old JSON cache
+        if LEGACY_DURATION_DB.exists():
+            legacy = load_json(LEGACY_DURATION_DB, {})
+            rows = []
+            if isinstance(legacy, dict):
+                for k, v in legacy.items():
+                    try:
+                        rows.append((str(k), int(v)))
+                    except Exception:
+                        continue
+            with conn:
+                conn.executemany("INSERT OR IGNORE INTO d (k, s) VALUES (?, ?)", rows)
+                _set_normalized(conn, False)
+            try:
+                LEGACY_DURATION_DB.replace(LEGACY_DURATION_DB.with_name(LEGACY_DURATION_DB.name + ".bak"))
+            except Exception:
+                pass
+
+        _conn = conn
+    return _conn
+
+
+def _all_seconds(values: Iterable) -> bool:
+    return all(sec_from_cache_val(v) == v for v in values)
+
+
+def _set_normalized(conn: sqlite3.Connection, flag: bool):
+    conn.execute(f"PRAGMA user_version = {_NORMALIZED if flag else 0}")
+
+
+def is_normalized() -> bool:
+    """True when the cache holds only normalised seconds (no startup pass needed)."""
+    try:
+        with _lock:
+            return _db().execute("PRAGMA user_version").fetchone()[0] == _NORMALIZED
+    except Exception:
+        return False
+
+
+def mark_normalized():
+    try:
+        with _lock:
+            conn = _db()
+            with conn:
+                _set_normalized(conn, True)
+    except Exception:
+        pass
 
 
 def load_dur_db() -> Dict[str, int]:
-    return {k: int(v) for k, v in load_json(DURATION_DB, {}).items()}
+    try:
+        with _lock:
+            return {k: int(s) for k, s in _db().execute("SELECT k, s FROM d")}
+    except Exception:
+        return {}
+
 
 def save_dur_db(db: Dict[str, int]):
-    save_json(DURATION_DB, db)
+    """Replace the whole cache with `db` (bulk rewrites: normalisation, category rename)."""
+    try:
+        with _lock:
+            conn = _db()
+            with conn:
+                conn.execute("DELETE FROM d")
+                conn.executemany("INSERT INTO d (k, s) VALUES (?, ?)", db.items())
+                _set_normalized(conn, _all_seconds(db.values()))
+    except Exception:
+        pass
+
+
+def set_durations(entries: Dict[str, int]):
+    """Upsert only the given keys (O(len(entries)), not a full rewrite)."""
+    try:
+        with _lock:
+            conn = _db()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO d (k, s) VALUES (?, ?)", entries.items())
+                if not _all_seconds(entries.values()):
+                    _set_normalized(conn, False)
+    except Exception:
+        pass
+
+
+def delete_durations(*keys: str):
+    """Drop the given keys from the cache."""
+    try:
+        with _lock:
+            conn = _db()
+            with conn:
+                conn.executemany("DELETE FROM d WHERE k = ?", [(k,) for k in keys])
+    except Exception:
+        pass
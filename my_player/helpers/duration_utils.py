@@ -6,10 +6,14 @@ from my_player.helpers.file_utils import resolve_existing_file
 
 def sec_from_cache_val(val) -> Optional[int]:
     """Return duration in seconds from mixed cache (seconds or milliseconds)."""
-    try:
-        v = int(val)
-    except Exception:
-        return None
+    # Fast path: cache values loaded from JSON are already plain ints.
+    if type(val) is int:
+        v = val
+    else:
+        try:
+            v = int(val)
+        except Exception:
+            return None
 
     # If value looks like milliseconds (>= 60,000) and converts to a plausible length (<12h), use ms→s.
     if v >= 60_000:
@@ -27,11 +31,12 @@ def sec_from_cache_val(val) -> Optional[int]:
 def cached_seconds(duration_db: Dict[str, int], s: Song) -> Optional[int]:
     """Return cached seconds for a song, checking both song-key and file-path keys."""
     try:
-        k1 = "|".join(s.key())
+        k1 = s.cache_key
         if k1 in duration_db:
             sec = sec_from_cache_val(duration_db[k1])
             if sec is not None:
                 return sec
+        # Only hit the path builder on a song-key miss
         p = resolve_existing_file(s, migrate=True)
         sp = str(p)
         if sp in duration_db:
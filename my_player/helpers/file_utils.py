@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
 
 from my_player.helpers.constants import SAFE_CHAR_RE, SONGS_DIR
 
@@ -15,6 +17,28 @@ if TYPE_CHECKING:
 _invalid_fs_chars = r'[<>:"/\\|?*\x00-\x1F]'
 _invalid_fs_re = re.compile(_invalid_fs_chars)
 
+# Path separators / drive colon become '-' in safe_filename
+_SEP_TRANS = str.maketrans({"/": "-", "\\": "-", ":": "-"})
+_COLLAPSE_RE = re.compile(r"[_\s]{2,}")
+
+# Coarsest directory mtime resolution we expect (FAT/exFAT: 2 s). A listing
+# taken within this long of the mtime may miss a file written in the same
+# tick, so it is not reused.
+_MTIME_SLACK_NS = 2_000_000_000
+
+
+def _sweep_part_files(dir_path: str):
+    """Yield paths of *.part files under dir_path (no symlink following)."""
+    try:
+        with os.scandir(dir_path) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    yield from _sweep_part_files(e.path)
+                elif e.name.endswith(".part"):
+                    yield e.path
+    except OSError:
+        return
+
 
 def delete_part_files() -> int:
     """
@@ -25,22 +49,22 @@ def delete_part_files() -> int:
     """
     # TODO: use this as a separate background thread operation for regular cleanup of part files
     deleted_count = 0
+    failed_count = 0
 
     if not SONGS_DIR.exists():
         return 0
 
-    for dir_path, _, files in os.walk(str(SONGS_DIR)):
-        for file_name in files:
-            if file_name.endswith(".part"):
-                full_path = os.path.join(dir_path, file_name)
-                try:
-                    os.remove(full_path)
-                    deleted_count += 1
-                    print(f"Deleted: {full_path}")
-                except OSError as e:
-                    print(f"Failed to delete {full_path}: {e}")
-
-    print(f"Total .part files deleted: {deleted_count}")
+    for full_path in _sweep_part_files(str(SONGS_DIR)):
+        try:
+            os.unlink(full_path)
+            deleted_count += 1
+        except OSError:
+            failed_count += 1
+
+    msg = f"Total .part files deleted: {deleted_count}"
+    if failed_count:
+        msg += f" ({failed_count} could not be deleted)"
+    print(msg)
     return deleted_count
 
 
@@ -54,12 +78,11 @@ def safe_filename(name: str) -> str:
     - Guard against control chars and very unsafe FS chars.
     - Collapse repeated spaces/underscores.
     """
-    name = name.strip().replace("/", "-").replace("\\", "-").replace(":", "-")
-    name = SAFE_CHAR_RE.sub("_", name)
-    name = _invalid_fs_re.sub("_", name)
+    # SAFE_CHAR_RE already covers every char in _invalid_fs_re (and control
+    # chars), so a single substitution pass is enough here.
+    name = SAFE_CHAR_RE.sub("_", name.strip().translate(_SEP_TRANS))
     # Collapse repeats
-    name = re.sub(r"[_\s]{2,}", " ", name)
-    return name.strip()
+    return _COLLAPSE_RE.sub(" ", name).strip()
 
 
 def _sanitize_filename(s: str, replace_with: str = "_") -> str:
@@ -69,14 +92,13 @@ def _sanitize_filename(s: str, replace_with: str = "_") -> str:
     Uses a stricter sanitisation than safe_filename, but the core
     behaviour is consistent with your original libio_compat.py logic.
     """
-    s = s.strip()
-    # First apply SAFE_CHAR_RE rules
-    s = SAFE_CHAR_RE.sub(replace_with, s)
-    # Then enforce filesystem-invalid characters rule
-    s = _invalid_fs_re.sub(replace_with, s)
+    s = SAFE_CHAR_RE.sub(replace_with, s.strip())
+    # SAFE_CHAR_RE output can only contain FS-invalid chars if the
+    # replacement itself does
+    if _invalid_fs_re.search(replace_with):
+        s = _invalid_fs_re.sub(replace_with, s)
     # Collapse repeated underscores/spaces
-    s = re.sub(r"[_\s]{2,}", " ", s)
-    return s.strip()
+    return _COLLAPSE_RE.sub(" ", s).strip()
 
 
 def _category_dir_name(category: str) -> str:
@@ -96,7 +118,7 @@ def _file_basename(song: "Song") -> str:
 
     Pattern: "{Title} - {artist1, artist2}.mp3"
     """
-    artists = ", ".join(song.artists) if getattr(song, "artists", None) else ""
+    artists = song.artists_str
     base = f"{song.title} - {artists}".strip()
     base = _sanitize_filename(base)
     if not base.lower().endswith(".mp3"):
@@ -135,3 +157,80 @@ def resolve_existing_file(song: "Song", migrate: bool = False) -> Path:
     # TODO: move songs between categories in csv files (migrate) is not implemented
     # TODO: also implement songs deletion from csv files
     return expected_path(song)
+
+
+def _dir_names(cdir: str, cached: Optional[dict] = None) -> Tuple[int, Set[str], bool]:
+    """
+    (mtime_ns, file names, listed) of a category directory. A `cached`
+    listing is reused when the directory's mtime is unchanged (adding,
+    removing or renaming a file bumps it); otherwise the directory is listed
+    again and `listed` is True. mtime is -1 when the listing must not be
+    cached: the directory is unreadable, or changed too recently to trust.
+    """
+    path = SONGS_DIR / cdir
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return -1, set(), True
+    if cached and cached.get("mtime") == mtime:
+        return mtime, set(cached.get("names", ())), False
+    try:
+        with os.scandir(path) as it:
+            names = {e.name for e in it}
+    except OSError:
+        return -1, set(), True
+    if time.time_ns() - mtime < _MTIME_SLACK_NS:
+        return -1, names, True
+    return mtime, names, True
+
+
+def missing_songs(
+    library: Dict[str, Iterable["Song"]],
+    listing_cache: Optional[Dict[str, dict]] = None,
+) -> List["Song"]:
+    """
+    Return songs whose expected_path() does not exist.
+
+    Lists each category directory once (os.scandir) and checks file names
+    against that set, instead of one stat() per song. The listings are
+    I/O-bound, so they are fetched concurrently. With `listing_cache`
+    ({dir: {"mtime", "names"}}, updated in place) unchanged directories are
+    only stat()ed, and only re-listed directories have their entry replaced.
+    """
+    dir_of: Dict[str, str] = {}
+    for rows in library.values():
+        for s in rows:
+            if s.category not in dir_of:
+                try:
+                    dir_of[s.category] = _category_dir_name(s.category)
+                except Exception:
+                    pass
+
+    cache = listing_cache if listing_cache is not None else {}
+    dirs = list(set(dir_of.values()))
+    if len(dirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+            results = list(ex.map(lambda d: _dir_names(d, cache.get(d)), dirs))
+    else:
+        results = [_dir_names(d, cache.get(d)) for d in dirs]
+
+    listings: Dict[str, Set[str]] = {}
+    for d, (mtime, names, listed) in zip(dirs, results):
+        listings[d] = names
+        if not listed:
+            continue
+        if mtime >= 0:
+            cache[d] = {"mtime": mtime, "names": sorted(names)}
+        else:
+            cache.pop(d, None)
+
+    out: List["Song"] = []
+    for rows in library.values():
+        for s in rows:
+            try:
+                if _file_basename(s) not in listings[dir_of[s.category]]:
+                    out.append(s)
+            except Exception:
+                # Ignore bad rows
+                pass
+    return out
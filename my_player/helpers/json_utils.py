@@ -1,7 +1,14 @@
 import json
+import os
 from pathlib import Path
 from typing import Any
 
+try:
+    # Optional: orjson parses/serialises several times faster than stdlib json.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_json(path: Path, default: Any) -> Any:
     """
@@ -10,6 +17,8 @@ def load_json(path: Path, default: Any) -> Any:
     try:
         if not path.exists():
             return default
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         with path.open("r", encoding="utf-8") as f:
             return json.load(f)
     except Exception:
@@ -19,11 +28,21 @@ def load_json(path: Path, default: Any) -> Any:
 def save_json(path: Path, data: Any) -> None:
     """
     Safe JSON saver.
+    Writes to a sibling temp file and atomically swaps it in, so a crash
+    mid-write never leaves a truncated file (which load_json would treat
+    as missing and silently reset).
     """
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
     except Exception:
         # Best-effort; errors are not fatal
         pass
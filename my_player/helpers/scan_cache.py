@@ -0,0 +1,38 @@
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from my_player.helpers.constants import SCAN_CACHE_DB
+from my_player.helpers.file_utils import missing_songs
+from my_player.helpers.json_utils import load_json, save_json
+from my_player.models.song import Song
+
+# {category dir: {"mtime": st_mtime_ns, "names": [file names]}}, loaded once per run
+_cache: Optional[Dict[str, dict]] = None
+_lock = threading.Lock()
+
+
+def load_scan_cache() -> Dict[str, dict]:
+    raw = load_json(SCAN_CACHE_DB, {})
+    if not isinstance(raw, dict):
+        return {}
+    return raw
+
+
+def save_scan_cache(cache: Dict[str, dict]) -> None:
+    save_json(SCAN_CACHE_DB, cache)
+
+
+def scan_missing(library: Dict[str, Iterable[Song]]) -> List[Song]:
+    """
+    missing_songs() backed by the persisted directory listings: directories
+    whose mtime hasn't changed since the last scan are not listed again.
+    """
+    global _cache
+    with _lock:
+        if _cache is None:
+            _cache = load_scan_cache()
+        before = {d: e.get("mtime") for d, e in _cache.items()}
+        miss = missing_songs(library, _cache)
+        if {d: e.get("mtime") for d, e in _cache.items()} != before:
+            save_scan_cache(_cache)
+    return miss
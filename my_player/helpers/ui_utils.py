@@ -10,5 +10,7 @@ def themed_msg(parent, icon: QMessageBox.Icon, title: str, text: str,
     box.setText(text)
     box.setIcon(icon)
     box.setStandardButtons(buttons)
-    box.setStyleSheet(MaterialTheme.stylesheet())
+    if parent is None:
+        # Parented boxes inherit the main window's sheet
+        box.setStyleSheet(MaterialTheme.stylesheet())
     return box
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from typing import List
+
+_ARTIST_SPLIT = re.compile(r"\s*,\s*")
 
 
 def title_case(s: str) -> str:
@@ -26,3 +29,14 @@ def norm(s: str) -> str:
     s = unicodedata.normalize("NFKD", s)
     s = "".join(ch for ch in s if not unicodedata.combining(ch))
     return " ".join(s.split())
+
+
+def parse_artists(field: str) -> List[str]:
+    """
+    Split a comma-separated artists field into stripped, non-empty names.
+    Single-artist fields (the common case) skip the split entirely.
+    """
+    field = field.strip()
+    if "," not in field:
+        return [field] if field else []
+    return [a for a in _ARTIST_SPLIT.split(field) if a]
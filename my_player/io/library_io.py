@@ -1,10 +1,37 @@
 import csv
+import mmap
+import os
+import pickle
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Iterable, Tuple
+from typing import Dict, List, Iterable, Optional, Tuple
+
+try:
+    # Optional: pyarrow parses CSVs in C, column-wise; the csv module path is the fallback.
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
 
 from my_player.models.song import Song
-from my_player.helpers.constants import LIBRARY_DIR, SONGS_DIR
-from my_player.helpers.file_utils import expected_path
+from my_player.helpers.constants import LIBRARY_CACHE_DB, LIBRARY_DIR, SONGS_DIR
+from my_player.helpers.file_utils import expected_path, _file_basename
+from my_player.helpers.utils import parse_artists
+
+# Characters dropped from category names when building CSV file names
+_UNSAFE_CATEGORY_CHARS_RE = re.compile(r"[^0-9A-Za-z _-]+")
+
+# Header aliases recognised by column_indices()
+_TITLE_ALIASES = ("title", "song")
+_ALBUM_ALIASES = ("album", "film", "film/album", "filmalbum")
+_ARTIST_ALIASES = ("artists", "artist", "singer", "singers")
+
+# Bump when the parsing rules change, to drop old pickles
+_LIBRARY_CACHE_VERSION = 1
 
 
 # ---------------------------------------------------------------------------
@@ -43,15 +70,120 @@ def column_indices(header_norm: List[str], default_len: int = 0) -> Tuple[int, i
             return default_pos
         return default_pos if default_len > default_pos else (default_len - 1)
 
-    title_ix = next((i for i, h in enumerate(header_norm) if h in ("title", "song")), _fallback_ix(0))
-    album_ix = next((i for i, h in enumerate(header_norm) if h in ("album", "film", "film/album", "filmalbum")),
-                    _fallback_ix(1))
-    artists_ix = next((i for i, h in enumerate(header_norm) if h in ("artists", "artist", "singer", "singers")),
-                      _fallback_ix(2))
+    # One pass over the header (first occurrence wins), then hash probes per alias
+    pos: Dict[str, int] = {}
+    for i, h in enumerate(header_norm):
+        pos.setdefault(h, i)
+
+    def _find(aliases: Tuple[str, ...], default_pos: int) -> int:
+        return min((pos[k] for k in aliases if k in pos), default=_fallback_ix(default_pos))
+
+    title_ix = _find(_TITLE_ALIASES, 0)
+    album_ix = _find(_ALBUM_ALIASES, 1)
+    artists_ix = _find(_ARTIST_ALIASES, 2)
 
     return title_ix, album_ix, artists_ix
 
 
+def _make_song(category_name: str, title: str, album: str, artists_raw: str) -> Optional[Song]:
+    """Build a Song from raw CSV fields; None for rows without a title (likely junk)."""
+    title = title.strip()
+    if not title:
+        return None
+    # Artist names repeat across the library: intern them so they are stored once
+    artists = [sys.intern(a) for a in parse_artists(artists_raw)]
+    return Song(category=category_name, title=title, album=album.strip(), artists=artists)
+
+
+def _load_category_arrow(
+    csv_path: str,
+    category_name: str,
+    first_row: List[str],
+    has_header: bool,
+    indices: Tuple[int, int, int],
+) -> Optional[List[Song]]:
+    """
+    Parse one category CSV with pyarrow and build Songs from whole columns.
+    Returns None when pyarrow is unavailable or can't parse the file
+    (e.g. ragged rows), so the caller falls back to the csv module.
+    """
+    if pa_csv is None:
+        return None
+    try:
+        ncols = len(first_row)
+        table = pa_csv.read_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(
+                use_threads=True,
+                skip_rows=1 if has_header else 0,
+                autogenerate_column_names=True,
+            ),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            # Everything is text: keep "007" / "1942" exactly as written
+            convert_options=pa_csv.ConvertOptions(
+                column_types={f"f{i}": pa.string() for i in range(ncols)},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+    except Exception:
+        return None
+
+    n = table.num_rows
+    cols = [
+        table.column(ix).to_pylist() if ix < table.num_columns else [""] * n
+        for ix in indices
+    ]
+    songs: List[Song] = []
+    for title, album, artists_raw in zip(*cols):
+        s = _make_song(category_name, title or "", album or "", artists_raw or "")
+        if s is not None:
+            songs.append(s)
+    return songs
+
+
+def _load_category_plain(
+    csv_path: str,
+    category_name: str,
+    has_header: bool,
+    indices: Tuple[int, int, int],
+) -> Optional[List[Song]]:
+    """
+    Fast path for quote-free CSVs (the usual category file): map the file,
+    confirm with one memchr-style scan that there is nothing csv.reader would
+    treat specially, then split lines/fields directly.
+    Returns None when the file needs the real csv module.
+    """
+    try:
+        with open(csv_path, "rb") as fb, mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'"') != -1:
+                return None
+            data = mm[:].replace(b"\r\n", b"\n")
+        if b"\r" in data:
+            # Bare CR line endings: leave to csv.reader
+            return None
+        lines = data.decode("utf-8").split("\n")
+    except (OSError, ValueError):
+        return None
+
+    title_idx, album_idx, artist_idx = indices
+    songs: List[Song] = []
+    for line in lines[1:] if has_header else lines:
+        if not line:
+            continue
+        row = line.split(",")
+        n = len(row)
+        s = _make_song(
+            category_name,
+            row[title_idx] if title_idx < n else "",
+            row[album_idx] if album_idx < n else "",
+            row[artist_idx] if artist_idx < n else "",
+        )
+        if s is not None:
+            songs.append(s)
+    return songs
+
+
 def _rename_category_csv(old_display_name: str, new_display_name: str) -> Path:
     """
     Rename the CSV file backing a category (display names like 'Kishore Kumar').
@@ -73,11 +205,11 @@ def _rename_category_csv(old_display_name: str, new_display_name: str) -> Path:
 
     # Find the existing CSV matching the old display name
     old_csv = None
-    for p in SONGS_DIR.glob("*.csv"):
-        stem_norm = norm_display(p.stem)
-        if stem_norm == old_norm:
-            old_csv = p
-            break
+    with os.scandir(SONGS_DIR) as it:
+        for e in it:
+            if e.name.endswith(".csv") and norm_display(e.name[:-4]) == old_norm:
+                old_csv = Path(e.path)
+                break
 
     if old_csv is None:
         raise FileNotFoundError(f"Could not find CSV for category “{old_display_name}” in {SONGS_DIR}")
@@ -103,6 +235,103 @@ def _rename_category_csv(old_display_name: str, new_display_name: str) -> Path:
 # Public API
 # ---------------------------------------------------------------------------
 
+def _load_one(entry: os.DirEntry) -> Tuple[str, List[Song]]:
+    """Load a single category CSV: (category_name, songs); songs is empty for unreadable files."""
+    csv_path = entry.path
+    # Category name is derived from the file name
+    category_name = entry.name[:-4].replace("_", " ").strip()
+    songs: List[Song] = []
+
+    try:
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+
+            # Peek the first row for header detection, then stream the rest
+            # straight into Song objects (no intermediate list of rows).
+            first_row = next(reader, None)
+            if first_row is None:
+                return category_name, songs
+
+            has_header = looks_like_header(first_row)
+            title_idx, album_idx, artist_idx = column_indices(first_row)
+
+            fast = _load_category_arrow(
+                csv_path, category_name, first_row, has_header,
+                (title_idx, album_idx, artist_idx),
+            )
+            if fast is None:
+                fast = _load_category_plain(
+                    csv_path, category_name, has_header,
+                    (title_idx, album_idx, artist_idx),
+                )
+            if fast is not None:
+                return category_name, fast
+
+            data_rows = reader if has_header else chain([first_row], reader)
+            for row in data_rows:
+                if not row:
+                    continue
+
+                # Defensive: rows can be shorter than expected
+                n = len(row)
+                s = _make_song(
+                    category_name,
+                    row[title_idx] if title_idx < n else "",
+                    row[album_idx] if album_idx < n else "",
+                    row[artist_idx] if artist_idx < n else "",
+                )
+                if s is not None:
+                    songs.append(s)
+    except OSError:
+        # Skip any unreadable file
+        return category_name, []
+
+    return category_name, songs
+
+
+def _load_library_cache(key: tuple) -> Optional[Dict[str, List[Song]]]:
+    """The pickled library if it was built from exactly these CSVs, else None."""
+    try:
+        with open(LIBRARY_CACHE_DB, "rb") as f:
+            cached = pickle.load(f)
+        if (
+            cached.get("version") == _LIBRARY_CACHE_VERSION
+            and cached.get("key") == key
+        ):
+            # Unpickled strings are fresh objects: re-intern the artists as _make_song does
+            intern = sys.intern
+            return {
+                cat: [Song(cat, t, al, [intern(a) for a in ar]) for t, al, ar in rows]
+                for cat, rows in cached["rows"].items()
+            }
+    except Exception:
+        pass
+    return None
+
+
+def _save_library_cache(key: tuple, library: Dict[str, List[Song]]) -> None:
+    # Plain (title, album, artists) tuples: about half the size of pickled
+    # Songs and faster to load, even with the Songs rebuilt afterwards.
+    rows = {
+        cat: [(s.title, s.album, s.artists) for s in songs]
+        for cat, songs in library.items()
+    }
+    tmp = LIBRARY_CACHE_DB.with_name(LIBRARY_CACHE_DB.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(
+                {"version": _LIBRARY_CACHE_VERSION, "key": key, "rows": rows},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, LIBRARY_CACHE_DB)
+    except Exception:
+        try:
+            tmp.unlink(missing_ok=True)
+        except Exception:
+            pass
+
+
 def load_library_from_csvs(library_dir: Path | None = None) -> Dict[str, List[Song]]:
     """
     Load all categories from CSVs into a mapping: {category_name: [Song, ...]}.
@@ -111,6 +340,8 @@ def load_library_from_csvs(library_dir: Path | None = None) -> Dict[str, List[So
     - Each `*.csv` file in that directory is treated as a category file.
       The *file name* (without extension, underscores converted to spaces)
       becomes the category name shown in the UI.
+    - The parsed result is pickled to LIBRARY_CACHE_DB, keyed on every CSV's
+      (name, mtime, size); an unchanged library is unpickled instead of parsed.
     """
     if library_dir is None:
         library_dir = LIBRARY_DIR
@@ -120,62 +351,43 @@ def load_library_from_csvs(library_dir: Path | None = None) -> Dict[str, List[So
     if not library_dir.exists():
         return library
 
-    for csv_path in sorted(library_dir.glob("*.csv")):
-        # Category name is derived from the file name
-        category_name = csv_path.stem.replace("_", " ").strip()
-        songs: List[Song] = []
-
-        try:
-            with csv_path.open("r", encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-        except OSError:
-            # Skip any unreadable file
-            continue
-
-        if not rows:
-            continue
-
-        first_row = rows[0]
-        has_header = looks_like_header(first_row)
-
-        if has_header:
-            title_idx, album_idx, artist_idx = column_indices(first_row)
-            data_rows = rows[1:]
-        else:
-            title_idx, album_idx, artist_idx = column_indices(first_row)
-            data_rows = rows
-
-        for row in data_rows:
-            if not row:
-                continue
-
-            # Defensive: rows can be shorter than expected
-            def safe_get(idx: int) -> str:
-                return row[idx].strip() if idx < len(row) else ""
-
-            title = safe_get(title_idx)
-            album = safe_get(album_idx)
-            artists_raw = safe_get(artist_idx)
-
-            if not title:
-                # no title -> skip; it's likely junk
-                continue
-
-            artists = [a.strip() for a in artists_raw.split(",") if a.strip()]
-
-            songs.append(
-                Song(
-                    category=category_name,
-                    title=title,
-                    album=album,
-                    artists=artists,
-                )
-            )
+    try:
+        with os.scandir(library_dir) as it:
+            entries = [
+                e for e in it
+                if e.name.endswith(".csv") and e.is_file()
+            ]
+    except OSError:
+        return library
+    entries.sort(key=lambda e: e.name)
 
+    try:
+        key = (
+            str(library_dir.resolve()),
+            tuple((e.name, st.st_mtime_ns, st.st_size) for e in entries for st in (e.stat(),)),
+        )
+    except OSError:
+        key = None
+    if key is not None:
+        cached = _load_library_cache(key)
+        if cached is not None:
+            return cached
+
+    # Files are independent: parse them concurrently (file reads and the C
+    # parsers release the GIL); map() keeps the sorted category order.
+    if len(entries) > 1:
+        with ThreadPoolExecutor() as ex:
+            results = list(ex.map(_load_one, entries))
+    else:
+        results = [_load_one(e) for e in entries]
+
+    for category_name, songs in results:
         if songs:
             library[category_name] = songs
 
+    if key is not None:
+        _save_library_cache(key, library)
+
     return library
 
 
@@ -189,15 +401,11 @@ def category_csv_path(
     - Spaces are converted to underscores.
     - Unsafe characters are stripped.
     """
-    import re
-
     if library_dir is None:
         library_dir = LIBRARY_DIR
 
     # Normalise the category file name
-    cleaned = re.sub(r"[^0-9A-Za-z _-]+", "", category_name).strip()
-    if not cleaned:
-        cleaned = "Unnamed"
+    cleaned = _UNSAFE_CATEGORY_CHARS_RE.sub("", category_name).strip() or "Unnamed"
 
     filename = cleaned.replace(" ", "_") + ".csv"
     return library_dir / filename
@@ -238,14 +446,14 @@ def append_rows_to_category_csv(
     # If file does not exist, write a simple header first
     file_exists = csv_path.exists()
 
-    with csv_path.open("a", encoding="utf-8", newline="") as f:
+    # One writerows() call over a large buffer instead of a writerow() per row
+    with csv_path.open("a", encoding="utf-8", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
 
         if not file_exists:
             writer.writerow(["title", "album", "artists"])
 
-        for title, album, artists in rows:
-            writer.writerow([title, album, artists])
+        writer.writerows((title, album, artists) for title, album, artists in rows)
 
     return csv_path
 
@@ -269,15 +477,24 @@ def rename_category_everywhere(
     moved_key_pairs: List[Tuple[Tuple[str, str, str, str], Tuple[str, str, str, str]]] = []
     songs_in_old = library.get(old_cat, [])
 
+    # The directory only depends on the category: resolve both once
+    old_dir = expected_path(Song(title="x", album="", artists=[], category=old_cat)).parent
+    new_dir = expected_path(Song(title="x", album="", artists=[], category=new_cat)).parent
+    if songs_in_old:
+        try:
+            new_dir.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            pass
+
     for s in songs_in_old:
         old_song = s
         new_song = Song(title=s.title, album=s.album, artists=s.artists, category=new_cat)
 
-        old_path = expected_path(old_song)
-        new_path = expected_path(new_song)
+        base = _file_basename(s)
+        old_path = old_dir / base
+        new_path = new_dir / base
 
         try:
-            new_path.parent.mkdir(parents=True, exist_ok=True)
             if old_path.exists():
                 if new_path.exists() and new_path != old_path:
                     try:
@@ -293,17 +510,8 @@ def rename_category_everywhere(
 
     # 3) Best-effort: remove the now-empty old category directory
     try:
-        if songs_in_old:
-            sample_old_dir = expected_path(
-                Song(
-                    title=songs_in_old[0].title,
-                    album=songs_in_old[0].album,
-                    artists=songs_in_old[0].artists,
-                    category=old_cat,
-                )
-            ).parent
-            if sample_old_dir.exists() and not any(sample_old_dir.iterdir()):
-                sample_old_dir.rmdir()
+        if songs_in_old and old_dir.exists() and not any(old_dir.iterdir()):
+            old_dir.rmdir()
     except Exception:
         pass
 
@@ -1,26 +1,41 @@
 import csv
+import os
 from pathlib import Path
-from typing import List
+from typing import Optional
 
 from my_player.models.song import Song
 from my_player.helpers.file_utils import safe_filename
 from my_player.helpers.constants import SONGS_DIR
 
 
-def _read_rows(csv_path: Path) -> List[list[str]]:
-    rows: List[list[str]] = []
-    if csv_path.exists():
-        with csv_path.open("r", encoding="utf-8-sig", newline="") as fh:
-            for r in csv.reader(fh):
-                if len(r) >= 3:
-                    rows.append([r[0], r[1], r[2]])
-    return rows
-
-
-def _write_rows(csv_path: Path, rows: List[list[str]]) -> None:
+def _rewrite_without(
+    csv_path: Path,
+    drop_row: list[str],
+    extra_row: Optional[list[str]] = None,
+) -> None:
+    """
+    Stream csv_path into a temp file, dropping the first row equal to
+    `drop_row` (and rows with fewer than 3 columns), optionally appending
+    `extra_row`, then atomically replace the original.
+    """
     csv_path.parent.mkdir(parents=True, exist_ok=True)
-    with csv_path.open("w", encoding="utf-8", newline="") as fh:
-        csv.writer(fh).writerows(rows)
+    tmp = csv_path.with_name(csv_path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8", newline="") as fout:
+        w = csv.writer(fout)
+        if csv_path.exists():
+            with csv_path.open("r", encoding="utf-8-sig", newline="") as fin:
+                dropped = False
+                for r in csv.reader(fin):
+                    if len(r) < 3:
+                        continue
+                    row = r[:3]
+                    if not dropped and row == drop_row:
+                        dropped = True
+                        continue
+                    w.writerow(row)
+        if extra_row is not None:
+            w.writerow(extra_row)
+    os.replace(tmp, csv_path)
 
 
 def _append_row(csv_path: Path, row: list[str]) -> None:
@@ -38,17 +53,13 @@ def update_song_row(old: Song, new: Song) -> None:
     old_csv = _csv_for_category(old.category)
     new_csv = _csv_for_category(new.category)
 
-    old_rows = _read_rows(old_csv)
-    try:
-        old_rows.remove([old.title, old.album, ", ".join(old.artists)])
-    except ValueError:
-        pass
+    old_row = [old.title, old.album, old.artists_str]
+    new_row = [new.title, new.album, new.artists_str]
 
     if old_csv == new_csv:
         # Update in place
-        old_rows.append([new.title, new.album, ", ".join(new.artists)])
-        _write_rows(old_csv, old_rows)
+        _rewrite_without(old_csv, old_row, new_row)
     else:
         # Move row across CSVs
-        _write_rows(old_csv, old_rows)
-        _append_row(new_csv, [new.title, new.album, ", ".join(new.artists)])
+        _rewrite_without(old_csv, old_row)
+        _append_row(new_csv, new_row)
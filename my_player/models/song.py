@@ -1,61 +1,93 @@
-from dataclasses import dataclass
-from typing import List, Tuple, Dict
+import sys
+from dataclasses import dataclass, field
+from typing import List, Tuple, Dict, Optional
 
 from my_player.helpers.file_utils import safe_filename
 from my_player.helpers.utils import norm
 from my_player.helpers.constants import YOUTUBE_SEARCH_FILTERS
 
 
-@dataclass
+@dataclass(slots=True)
 class Song:
     category: str
     title: str
     album: str
     artists: List[str]
+    # Memoized derived values; call invalidate() after editing fields in place.
+    _key: Optional[Tuple[str, str, str, str]] = field(default=None, init=False, repr=False, compare=False)
+    _cache_key: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _fname: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _variants_cache: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def invalidate(self) -> None:
+        """Drop memoized key/filename/variants after category/title/album/artists change."""
+        self._key = None
+        self._cache_key = None
+        self._fname = None
+        self._variants_cache = None
 
     def key(self) -> Tuple[str, str, str, str]:
         """
         Return a canonical key for this song used in history, playlists, etc.
         """
-        return (
-            self.category,
-            self.title,
-            self.album,
-            ", ".join(self.artists),
-        )
+        if self._key is None:
+            self._key = (
+                self.category,
+                self.title,
+                self.album,
+                # Interned: the same artist line repeats across many songs
+                sys.intern(", ".join(self.artists)),
+            )
+        return self._key
+
+    @property
+    def artists_str(self) -> str:
+        """Artists joined with ", " (memoized via key())."""
+        return self.key()[3]
+
+    @property
+    def cache_key(self) -> str:
+        """
+        key() joined with "|", as used by the duration cache.
+        """
+        if self._cache_key is None:
+            self._cache_key = "|".join(self.key())
+        return self._cache_key
 
     def query_variants(self) -> List[str]:
         """
         Return multiple text variants to try when searching on YouTube.
         """
-        artist_str = ", ".join(self.artists) if self.artists else ""
+        if self._variants_cache is not None:
+            return self._variants_cache
+
+        artist_str = self.artists_str
         base = f"{self.title} {artist_str}".strip()
+        album = self.album
+        filters = YOUTUBE_SEARCH_FILTERS
 
         variants = [base]
 
         # Extended variants using YOUTUBE_SEARCH_FILTERS
-        for kw in YOUTUBE_SEARCH_FILTERS:
+        for kw in filters:
             variants.append(f"{base} {kw}")
-            if self.album:
-                variants.append(f"{base} {self.album} {kw}")
-
-        # Clean up + dedupe
-        seen = set()
-        out = []
-        for s in variants:
-            t = " ".join(s.split())
-            if t and t not in seen:
-                seen.add(t)
-                out.append(norm(t))
+            if album:
+                variants.append(f"{base} {album} {kw}")
+
+        # Clean up + dedupe (dict keeps first-seen order)
+        out = list(dict.fromkeys(norm(t) for t in (" ".join(v.split()) for v in variants) if t))
 
+        self._variants_cache = out
         return out
 
     def out_filename(self) -> str:
-        artist_str = ", ".join(self.artists) if self.artists else ""
-        base = f"{self.title}"
-        if artist_str:
-            base += f" - {artist_str}"
-        return safe_filename(base) + ".mp3"
+        if self._fname is None:
+            artist_str = self.artists_str
+            base = f"{self.title}"
+            if artist_str:
+                base += f" - {artist_str}"
+            self._fname = safe_filename(base) + ".mp3"
+        return self._fname
 
 
 def key_to_dict(key: Tuple[str, str, str, str]) -> Dict[str, str]:
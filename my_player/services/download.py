@@ -1,22 +1,48 @@
 import threading
 import queue
-import subprocess
-import sys
 import time
-import re
 import os
+from collections import deque
 
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from PyQt6.QtCore import QObject, pyqtSignal
 
-from my_player.helpers.constants import BAD_SEARCH_KEYWORDS, MIN_SEC, MAX_SEC
+from my_player.helpers.constants import (
+    BAD_KW_PATTERN,
+    BG_QUEUE_MAX,
+    MIN_SEC,
+    MAX_SEC,
+    PROGRESS_EMIT_MS,
+    YTDLP_DEFAULT_ARGS,
+    YTDLP_PROGRESS_HOOK_KEY,
+)
 from my_player.models.song import Song
+from my_player.helpers.duration_utils import mmss_from_seconds
 from my_player.helpers.file_utils import expected_path
 from my_player.models.download import DownloadJob
 
 
+class _YdlLogger:
+    """Collects yt-dlp warnings/errors so a failed download can report why."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def debug(self, msg: str) -> None:
+        pass
+
+    def info(self, msg: str) -> None:
+        pass
+
+    def warning(self, msg: str) -> None:
+        self.lines.append(msg)
+
+    def error(self, msg: str) -> None:
+        self.lines.append(msg)
+
+
 class DownloadManager(QObject):
     file_ready = pyqtSignal(object, bool, str)  # song, ok, path_or_err
     progress   = pyqtSignal(str, int, str, str, str)  # title, pct, speed, eta, category
@@ -24,47 +50,115 @@ class DownloadManager(QObject):
 
     def __init__(self, parent=None, bg_concurrency=4, custom_map: Optional[Dict[str, str]]=None, history=None):
         super().__init__(parent)
-        self._custom = custom_map or {}
-        self._history = history or {}
+        # Shared with the main window, which fills these in place after construction
+        self._custom = custom_map if custom_map is not None else {}
+        self._history = history if history is not None else {}
 
         self._stop = False
         self._high_q: queue.Queue[DownloadJob] = queue.Queue()
-        self._bg_q: queue.Queue[DownloadJob] = queue.Queue()
-        self._bg_enabled = False
+        # Background jobs: a bounded queue the workers pull from, fed by one
+        # feeder thread from a backlog; songs already queued/in flight are
+        # skipped, so repeated missing-scans don't pile up duplicates.
+        self._bg_q: queue.Queue[DownloadJob] = queue.Queue(maxsize=BG_QUEUE_MAX)
+        self._bg_backlog: Deque[DownloadJob] = deque()
+        self._bg_pending: Set[Tuple[str, str, str, str]] = set()
+        self._bg_lock = threading.Lock()
+        self._bg_feeder: Optional[threading.Thread] = None
+        # Background gate: bg workers block on this instead of polling/requeueing
+        self._bg_enabled = threading.Event()
 
         # Repeat-403 guard
         self._recent_403 = 0
         self._last_403_ts = 0.0
         self._pause_until = 0.0  # epoch seconds
 
+        # Per-download-invariant yt-dlp options, built on the first download (see _base_opts)
+        self._ydl_base_opts: Optional[dict] = None
+        self._opts_lock = threading.Lock()
+
         self._hi_workers: List[threading.Thread] = []
         self._bg_workers: List[threading.Thread] = []
         self._spawn_workers(hi=2, bg=bg_concurrency)
 
-        # Housekeeping timer (on Qt thread) just to emit throttled progress from workers if needed
-        self._pulse = QTimer(self)
-        self._pulse.setInterval(1000)
-        self._pulse.timeout.connect(lambda: None)
-        self._pulse.start()
-
     # ---------- public ----------
     def enqueue_high(self, song: Song, refresh: bool):
         self._high_q.put(DownloadJob(song=song, refresh=refresh, high=True))
 
     def enqueue_background_many(self, songs: List[Song]):
-        for s in songs:
-            self._bg_q.put(DownloadJob(song=s, refresh=False, high=False))
+        """Queue background downloads (non-blocking; duplicates of pending songs are dropped)."""
+        with self._bg_lock:
+            for s in songs:
+                k = s.key()
+                if k not in self._bg_pending:
+                    self._bg_pending.add(k)
+                    self._bg_backlog.append(DownloadJob(song=s, refresh=False, high=False))
+            self._ensure_bg_feeder()
 
     def resume_background(self):
-        self._bg_enabled = True
+        self._bg_enabled.set()
 
     def pause_background(self):
-        self._bg_enabled = False
+        self._bg_enabled.clear()
 
     def has_high_running(self) -> bool:
         return not self._high_q.empty()
 
     # ---------- workers ----------
+    def _base_opts(self) -> dict:
+        """
+        yt-dlp options shared by all workers (filters, reject pattern,
+        postprocessing); each download only adds its own output path, logger
+        and progress hook. yt_dlp is imported here, on the first download's
+        worker thread, so it never weighs on app startup.
+        """
+        with self._opts_lock:
+            if self._ydl_base_opts is None:
+                from yt_dlp.utils import match_filter_func
+
+                self._ydl_base_opts = {
+                    **YTDLP_DEFAULT_ARGS,
+                    "postprocessors": [
+                        {"key": "FFmpegExtractAudio", "preferredcodec": "mp3", "preferredquality": "5"},
+                    ],
+                    "retry_sleep_functions": {"http": lambda _n: 1},
+                    "concurrent_fragment_downloads": 1,
+                    "match_filter": match_filter_func(f"duration < {MAX_SEC} & duration > {MIN_SEC}"),
+                    # yt-dlp matches this case-insensitively against the video title
+                    "rejecttitle": BAD_KW_PATTERN,
+                }
+            return self._ydl_base_opts
+
+    def _ensure_bg_feeder(self):
+        """Start the feeder thread if there is backlog and none is running (call with _bg_lock held)."""
+        if self._bg_backlog and (self._bg_feeder is None or not self._bg_feeder.is_alive()):
+            self._bg_feeder = threading.Thread(target=self._bg_feed_loop, daemon=True)
+            self._bg_feeder.start()
+
+    def _bg_feed_loop(self):
+        """Move backlog into the bounded queue, blocking while it is full (backpressure)."""
+        while not self._stop:
+            with self._bg_lock:
+                if not self._bg_backlog:
+                    self._bg_feeder = None
+                    return
+                job = self._bg_backlog.popleft()
+            while not self._stop:
+                try:
+                    self._bg_q.put(job, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+
+    def _requeue(self, q: queue.Queue[DownloadJob], job: DownloadJob):
+        if job.high:
+            q.put(job)
+        else:
+            # Never block a worker on the bounded queue: go through the backlog
+            with self._bg_lock:
+                self._bg_backlog.appendleft(job)
+                self._ensure_bg_feeder()
+
+
     def _spawn_workers(self, hi: int, bg: int):
         for _ in range(hi):
             t = threading.Thread(target=self._worker_loop, args=(self._high_q, True), daemon=True)
@@ -75,6 +169,11 @@ class DownloadManager(QObject):
 
     def _worker_loop(self, q: queue.Queue[DownloadJob], is_high: bool):
         while not self._stop:
+            # Paused background workers sleep here until resume_background()
+            # (the timeout only lets them notice _stop).
+            if not is_high and not self._bg_enabled.wait(timeout=1.0):
+                continue
+
             try:
                 job: DownloadJob = q.get(timeout=0.25)
             except queue.Empty:
@@ -83,12 +182,14 @@ class DownloadManager(QObject):
             # Respect queue pause after too many 403s
             if time.time() < self._pause_until:
                 time.sleep(0.5)
-                q.put(job)  # requeue
+                q.task_done()
+                self._requeue(q, job)
                 continue
 
-            if (not is_high) and (not self._bg_enabled):
-                time.sleep(0.2)
-                q.put(job)
+            if (not is_high) and (not self._bg_enabled.is_set()):
+                # Paused between wait() and get(): hand the job back and go wait
+                q.task_done()
+                self._requeue(q, job)
                 continue
 
             s = job.song
@@ -110,54 +211,81 @@ class DownloadManager(QObject):
             except Exception as e:
                 self.file_ready.emit(s, False, str(e))
             finally:
+                if not is_high:
+                    with self._bg_lock:
+                        self._bg_pending.discard(s.key())
                 q.task_done()
 
     # ---------- yt-dlp wrapper ----------
+    def _progress_hook(self, s: Song):
+        """
+        yt-dlp progress hook forwarding real percentages to self.progress.
+        yt-dlp calls it many times a second, so updates are throttled to one
+        per PROGRESS_EMIT_MS; "finished" is always forwarded.
+        """
+        last_emit = 0.0
+
+        def hook(d: dict) -> None:
+            nonlocal last_emit
+            status = d.get("status")
+            if status == "finished":
+                self.progress.emit(s.title, 100, "", "", s.category)
+                return
+            if status != "downloading":
+                return
+            now = time.monotonic()
+            if (now - last_emit) * 1000 < PROGRESS_EMIT_MS:
+                return
+            last_emit = now
+            total = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
+            done = d.get("downloaded_bytes") or 0
+            pct = min(100, int(done * 100 / total)) if total else 0
+            speed = d.get("speed")
+            eta = d.get("eta")
+            self.progress.emit(
+                s.title,
+                pct,
+                f"{speed / 1048576:.1f} MiB/s" if speed else "",
+                mmss_from_seconds(int(eta)) if eta is not None else "",
+                s.category,
+            )
+        return hook
+
     def _download_song_file(self, s: Song, out_path: str) -> Tuple[bool, str]:
         """
         Prefer exact/wildcard custom URL; otherwise search with tight filters to avoid jukeboxes.
-        Emits early progress via self.progress for better UI feedback.
+        Runs yt-dlp in-process (no interpreter spawn per song) and streams progress via self.progress.
         """
-        # Let UI know immediately
-        try:
-            self.progress.emit(s.title, 0, "", "", s.category)
-        except Exception:
-            pass
-
         # Pick source (custom URL first)
         key_exact = "||".join(s.key())
-        key_wild  = "||".join(("*", s.title, s.album, ", ".join(s.artists)))
-        if hasattr(self, "_custom") and key_exact in self._custom:
-            source = self._custom[key_exact]
-        elif hasattr(self, "_custom") and key_wild in self._custom:
-            source = self._custom[key_wild]
-        else:
-            source = f"ytsearch1:{s.title} {', '.join(s.artists)} {s.album}".strip()
+        key_wild  = "||".join(("*", s.title, s.album, s.artists_str))
+        source = (
+            self._custom.get(key_exact)
+            or self._custom.get(key_wild)
+            or f"ytsearch1:{s.title} {s.artists_str} {s.album}".strip()
+        )
 
         Path(os.path.dirname(out_path)).mkdir(parents=True, exist_ok=True)
 
-        rej = "|".join(re.escape(k) for k in (BAD_SEARCH_KEYWORDS or []))
-        cmd = [
-            sys.executable, "-m", "yt_dlp",
-            "--no-playlist",
-            "-f", "bestaudio/best",
-            "-x", "--audio-format", "mp3",
-            "-o", out_path,
-            "--retry-sleep", "1",
-            "--concurrent-fragments", "1",
-            "--match-filter", f"duration < {MAX_SEC} & duration > {MIN_SEC}",
-        ]
-        if rej:
-            cmd += ["--reject-title", rej]
-        cmd.append(source)
+        logger = _YdlLogger()
+        opts = {
+            **self._base_opts(),
+            "outtmpl": out_path,
+            "logger": logger,
+            YTDLP_PROGRESS_HOOK_KEY: [self._progress_hook(s)],
+        }
+
+        from yt_dlp import YoutubeDL
 
         try:
-            proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            with YoutubeDL(opts) as ydl:
+                ydl.download([source])
         except Exception as e:
-            return False, str(e)
+            err = "\n".join(logger.lines).strip() or str(e)
+            return False, err[:500]
 
-        if proc.returncode == 0 and Path(out_path).exists():
+        if Path(out_path).exists():
             return True, "ok"
 
-        err = (proc.stderr or proc.stdout or "").strip()
+        err = "\n".join(logger.lines).strip()
         return False, (err[:500] if err else "Download failed")
@@ -1,4 +1,6 @@
-from typing import Dict, List
+import threading
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
 
 from PyQt6.QtCore import QObject, pyqtSignal, QRunnable
 
@@ -10,37 +12,145 @@ class _SearchSignals(QObject):
     done = pyqtSignal(int, object)  # seq, List[Song]
 
 
+class SearchIndex:
+    """
+    Pre-normalised haystacks for every song in a library, reused across queries.
+
+    Stored column-wise: `songs` and `hays` are parallel lists laid out
+    category by category, so a category view scans one contiguous slice.
+
+    The haystacks are also joined into one newline-separated blob, so a
+    query token is located with str.find (a C-level scan) and only the rows
+    it hits are visited in Python.
+
+    Built lazily (on the first search, i.e. in the worker thread) and tied to
+    one library object; the owner creates a new index when self.library is
+    replaced.
+    """
+
+    def __init__(self, library: Dict[str, List[Song]]):
+        self.library = library
+        self.songs: List[Song] = []
+        self.hays: List[str] = []
+        self._by_id: Dict[int, str] = {}
+        self._ranges: Dict[int, Tuple[int, int]] = {}  # id(category row list) -> (start, end)
+        self._blob = ""
+        self._starts: List[int] = []  # offset of each haystack in _blob
+        self._built = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def haystack(s: Song) -> str:
+        return norm(" | ".join([s.category, s.title, s.album, s.artists_str]))
+
+    def _ensure(self) -> None:
+        if self._built:
+            return
+        with self._lock:
+            if self._built:
+                return
+            songs: List[Song] = []
+            ranges: Dict[int, Tuple[int, int]] = {}
+            for rows in self.library.values():
+                start = len(songs)
+                songs.extend(rows)
+                ranges[id(rows)] = (start, len(songs))
+            hays = [self.haystack(s) for s in songs]
+            starts: List[int] = []
+            pos = 0
+            for h in hays:
+                starts.append(pos)
+                pos += len(h) + 1
+            self._blob = "\n".join(hays)
+            self._starts = starts
+            self.songs, self.hays = songs, hays
+            self._ranges = ranges
+            self._by_id = {id(s): h for s, h in zip(songs, hays)}
+            self._built = True
+
+    def build(self) -> "SearchIndex":
+        """Build the haystacks now (e.g. from a loader thread) instead of on first search."""
+        self._ensure()
+        return self
+
+    def all_songs(self) -> List[Song]:
+        self._ensure()
+        return list(self.songs)
+
+    def _rows_containing(self, tok: str, a: int, b: int) -> List[int]:
+        """Indices in [a, b) whose haystack contains `tok` (tokens never contain a newline)."""
+        if a >= b:
+            return []
+        starts, find = self._starts, self._blob.find
+        hi = starts[b - 1] + len(self.hays[b - 1])
+        n = len(starts)
+        out: List[int] = []
+        pos = find(tok, starts[a], hi)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            out.append(i)
+            if i + 1 >= n:
+                break
+            # Continue from the next haystack; one hit per row is enough
+            pos = find(tok, starts[i + 1], hi)
+        return out
+
+    def search(self, query: str, rows: Optional[List[Song]] = None) -> List[Song]:
+        """
+        Songs whose haystack contains every query token.
+        `rows` restricts the search (e.g. current category/playlist view);
+        default is the whole library.
+        """
+        self._ensure()
+        toks = norm(query).split() if query else []
+        span = self._ranges.get(id(rows)) if rows is not None else None
+        if rows is None:
+            span = (0, len(self.songs))
+        elif span is None or span[1] - span[0] != len(rows):
+            # Arbitrary list (playlist / favourites view): per-row check
+            by_id = self._by_id
+            pairs = ((by_id.get(id(s)) or self.haystack(s), s) for s in rows)
+            return [s for hay, s in pairs if all(tok in hay for tok in toks)]
+
+        # Whole library or one category: contiguous slice of the blob
+        a, b = span
+        if not toks:
+            return self.songs[a:b]
+        # The longest token is usually the most selective; locate it in the
+        # blob, then check the remaining tokens on the candidate rows only.
+        toks.sort(key=len, reverse=True)
+        first, rest = toks[0], toks[1:]
+        hays, songs = self.hays, self.songs
+        return [
+            songs[i]
+            for i in self._rows_containing(first, a, b)
+            if all(tok in hays[i] for tok in rest)
+        ]
+
+
 class SearchTask(QRunnable):
-    def __init__(self, seq: int, mode: str, query: str, library: Dict[str, List[Song]], base_list: List[Song]):
+    def __init__(
+        self,
+        seq: int,
+        mode: str,
+        query: str,
+        library: Dict[str, List[Song]],
+        base_list: List[Song],
+        index: Optional[SearchIndex] = None,
+    ):
         super().__init__()
         self.seq = seq
         self.mode = mode  # "Category" or "Global"
         self.query = query
         self.library = library
         self.base_list = base_list
+        self.index = index if index is not None else SearchIndex(library)
         self.signals = _SearchSignals()
 
     def run(self):
         q = (self.query or "").strip()
         if self.mode == "Category":
-            songs = self._filter_any(self.base_list, q)
+            songs = self.index.search(q, self.base_list)
         else:
-            if not q:
-                songs = [s for rows in self.library.values() for s in rows]
-            else:
-                everything = [s for rows in self.library.values() for s in rows]
-                songs = self._filter_any(everything, q)
+            songs = self.index.search(q)
         self.signals.done.emit(self.seq, songs)
-
-    @staticmethod
-    def _filter_any(rows: List[Song], query: str) -> List[Song]:
-        if not query:
-            return list(rows)
-        toks = norm(query).split()
-        out: List[Song] = []
-        for s in rows:
-            hay = " | ".join([s.category, s.title, s.album, ", ".join(s.artists)]).lower()
-            hay_n = norm(hay)
-            if all(tok in hay_n for tok in toks):
-                out.append(s)
-        return out
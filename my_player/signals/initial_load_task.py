@@ -0,0 +1,45 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from my_player.helpers.db_utils import is_normalized, load_dur_db, mark_normalized, save_dur_db
+from my_player.helpers.duration_utils import sec_from_cache_val
+from my_player.helpers.player_history_utils import load_history, load_custom
+from my_player.io.library_io import load_library_from_csvs
+from my_player.services.search import SearchIndex
+
+
+class _InitialLoadTaskSignals(QObject):
+    done = pyqtSignal(object, object, object, object, object)  # library, duration_db, history, custom_urls, search index
+
+
+class InitialLoadTask(QRunnable):
+    """Loads the library and the persisted caches off the UI thread at startup."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _InitialLoadTaskSignals()
+
+    def run(self):
+        library = load_library_from_csvs()
+
+        # Duration cache (mixed legacy sec/ms -> normalize) and persist once.
+        # Skipped when the DB is already stamped as normalised.
+        duration_db = load_dur_db()
+        if not is_normalized():
+            changed = False
+            for k, v in list(duration_db.items()):
+                sec = sec_from_cache_val(v)
+                if sec is None:
+                    duration_db.pop(k, None)
+                    changed = True
+                elif sec != v:
+                    duration_db[k] = sec
+                    changed = True
+            if changed:
+                save_dur_db(duration_db)
+            else:
+                mark_normalized()
+
+        # Normalise search haystacks here too, so the first keystroke doesn't pay for it
+        index = SearchIndex(library).build()
+
+        self.signals.done.emit(library, duration_db, load_history(), load_custom(), index)
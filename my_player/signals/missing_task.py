@@ -3,7 +3,7 @@ from typing import Dict, List
 from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 from my_player.models.song import Song
-from my_player.helpers.file_utils import expected_path
+from my_player.helpers.scan_cache import scan_missing
 
 
 class _ScanMissingTaskSignals(QObject):
@@ -17,13 +17,5 @@ class ScanMissingTask(QRunnable):
         self.signals = _ScanMissingTaskSignals()
 
     def run(self):
-        miss: List[Song] = []
-        for rows in self.library.values():
-            for s in rows:
-                try:
-                    if not expected_path(s).exists():
-                        miss.append(s)
-                except Exception:
-                    # Ignore bad rows
-                    pass
+        miss: List[Song] = scan_missing(self.library)
         self.signals.done.emit(miss)
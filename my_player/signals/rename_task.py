@@ -0,0 +1,30 @@
+from typing import Dict, List
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from my_player.io.library_io import rename_category_everywhere
+from my_player.models.song import Song
+
+
+class _RenameCategoryTaskSignals(QObject):
+    done = pyqtSignal(str, str, object)  # old category, new category, [(old_key, new_key), ...]
+    failed = pyqtSignal(str)  # error message
+
+
+class RenameCategoryTask(QRunnable):
+    """Renames a category's CSV and moves its downloaded files off the UI thread."""
+
+    def __init__(self, old_cat: str, new_cat: str, library: Dict[str, List[Song]]):
+        super().__init__()
+        self.old_cat = old_cat
+        self.new_cat = new_cat
+        self.library = library
+        self.signals = _RenameCategoryTaskSignals()
+
+    def run(self):
+        try:
+            moved_pairs = rename_category_everywhere(self.old_cat, self.new_cat, self.library)
+        except Exception as e:
+            self.signals.failed.emit(f"{e}")
+            return
+        self.signals.done.emit(self.old_cat, self.new_cat, moved_pairs)
@@ -5,9 +5,9 @@ from PyQt6.QtWidgets import (
     QCheckBox, QDialogButtonBox, QMessageBox
 )
 
-from my_player.ui.theme import MaterialTheme
 from my_player.models.song import Song
 from my_player.helpers.ui_utils import themed_msg
+from my_player.helpers.utils import parse_artists
 
 
 class AddCategoryDialog(QDialog):
@@ -15,7 +15,6 @@ class AddCategoryDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Add / Append Category")
         self.setModal(True)
-        self.setStyleSheet(MaterialTheme.stylesheet())
         self.rows: List[Song] = []
         self.category: Optional[str] = None
 
@@ -38,7 +37,7 @@ class AddCategoryDialog(QDialog):
         cat = self.category_edit.text().strip()
         title = self.song_edit.text().strip()
         album = self.album_edit.text().strip()
-        artists = [a.strip() for a in self.artists_edit.text().split(",") if a.strip()]
+        artists = parse_artists(self.artists_edit.text())
         if not cat or not title:
             themed_msg(self, QMessageBox.Icon.Warning, "Missing", "Please enter at least Category and Song.").exec()
             return
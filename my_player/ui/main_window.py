@@ -1,27 +1,24 @@
+import os
 from typing import Dict, List, Optional, Tuple
 from collections import deque
 
 # QT
 from PyQt6.QtCore import (
-    Qt, QTimer, QThreadPool, QEvent
+    Qt, QTimer, QThreadPool, QEvent, QSignalBlocker
 )
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QListWidget, QLineEdit, QTableWidget,
+    QPushButton, QLabel, QListWidget, QLineEdit, QTableView,
     QHeaderView, QSplitter, QComboBox, QAbstractItemView, QSlider
 )
 from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
 
 # helpers -- constants
-from my_player.helpers.constants import APP_NAME, APP_WINDOW_WIDTH, APP_WINDOW_HEIGHT
-
-# helpers -- utilities
-from my_player.helpers.db_utils import load_dur_db, save_dur_db
-from my_player.helpers.player_history_utils import load_history, load_custom
-
-# io
-from my_player.io.library_io import load_library_from_csvs
+from my_player.helpers.constants import (
+    APP_NAME, APP_WINDOW_WIDTH, APP_WINDOW_HEIGHT, POSITION_UI_MS, SEARCH_DEBOUNCE_MS,
+    STATE_SAVE_DEBOUNCE_MS
+)
 
 # models
 from my_player.models.song import Song
@@ -29,6 +26,9 @@ from my_player.models.song import Song
 # services
 from my_player.services.download import DownloadManager
 
+# signals
+from my_player.signals.initial_load_task import InitialLoadTask
+
 # UI -- theme
 from my_player.ui.theme import MaterialTheme
 
@@ -38,6 +38,7 @@ from my_player.ui.widgets.empty_hint import EmptyHint
 from my_player.ui.widgets.current_song_highlighter import MaterialRowDelegate
 from my_player.ui.widgets.seek_bar import SeekSlider
 from my_player.ui.widgets.song_time import SongTimeLabelMMSS
+from my_player.ui.widgets.song_table_model import SongTableModel
 
 # UI -- mixins
 from my_player.ui.mixins.state_mixin import StateMixin
@@ -80,45 +81,39 @@ class MyPlayerMain(
         self._setup_app_window()
 
         # --- Data/state in memory -------------------------------------------------
-        self.library: Dict[str, List[Song]] = load_library_from_csvs()
+        # Library + caches are filled by InitialLoadTask (see _on_initial_load)
+        self.library: Dict[str, List[Song]] = {}
         self.current_category: Optional[str] = None
+        # Parsed current_category; only changed through _set_current_category()
+        self._view_kind: str = "category"
+        self._view_name: str = ""
         self.current_list: List[Song] = []
+        # (category, scope, query) that current_list was rendered for
+        self._shown_view: Optional[Tuple[Optional[str], str, str]] = None
         self._user_seeking: bool = False
         self._duration_ms: int = 0
 
-        # Duration cache (mixed legacy sec/ms -> normalize below)
-        self.duration_db: Dict[str, int] = load_dur_db()
-
-        # Normalize duration DB (convert ms→s, drop bad values) and persist once.
-        changed = False
-        for k, v in list(self.duration_db.items()):
-            sec = self._sec_from_cache_val(v)
-            if sec is None:
-                self.duration_db.pop(k, None)
-                changed = True
-            elif sec != v:
-                self.duration_db[k] = sec
-                changed = True
-        if changed:
-            save_dur_db(self.duration_db)
-
-        self.history: Dict[str, dict] = load_history()
-        self.custom_urls: Dict[str, str] = load_custom()
+        self.duration_db: Dict[str, int] = {}
+        # Shared by reference with DownloadManager; filled in place once loaded
+        self.history: Dict[str, dict] = {}
+        self.custom_urls: Dict[str, str] = {}
 
         self.favourites: set[Tuple[str, str, str, str]] = set()
         self.playlists: Dict[str, List[Tuple[str, str, str, str]]] = {}
+        # sorted(self.playlists) for menus/panel; reset to None whenever a name is added/removed
+        self._sorted_playlist_names: Optional[List[str]] = None
 
         # Typing debounce for search
         self._type_debounce = QTimer(self)
-        self._type_debounce.setInterval(220)
+        self._type_debounce.setInterval(SEARCH_DEBOUNCE_MS)
         self._type_debounce.setSingleShot(True)
         self._type_debounce.timeout.connect(self._apply_search_now)
 
-        # Incremental table-population state
-        self._populate_timer: Optional[QTimer] = None
-        self._populate_source: List[Song] = []
-        self._populate_index: int = 0
-        self._populate_gen: int = 0
+        # Debounced state save for rapid-fire changes (volume slider drags)
+        self._state_save_timer = QTimer(self)
+        self._state_save_timer.setInterval(STATE_SAVE_DEBOUNCE_MS)
+        self._state_save_timer.setSingleShot(True)
+        self._state_save_timer.timeout.connect(self._save_state)
 
         # --- Download manager: fully off GUI thread --------------------------------
         self.dlm = DownloadManager(self, bg_concurrency=6, custom_map=self.custom_urls, history=self.history)
@@ -130,7 +125,11 @@ class MyPlayerMain(
         self._prefetch_triggered: bool = False
         self._prefetch_in_progress: bool = False
         self._prefetch_next_key: Optional[Tuple[str, str, str, str]] = None
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.timeout.connect(self._start_next_prefetch)
         self._deferred_hi: deque[Tuple[Song, bool]] = deque()
+        self._hi_flush_pending: bool = False
 
         # --- Player ----------------------------------------------------------------
         self.audio_output = QAudioOutput()
@@ -138,7 +137,14 @@ class MyPlayerMain(
         self.player.setAudioOutput(self.audio_output)
         self.player.mediaStatusChanged.connect(self._on_media_status)
         self.player.positionChanged.connect(self._on_pos_changed)
+        # Position ticks are coalesced: the latest one is applied when this fires
+        self._pos_pending_ms: int = 0
+        self._pos_timer = QTimer(self)
+        self._pos_timer.setSingleShot(True)
+        self._pos_timer.setInterval(POSITION_UI_MS)
+        self._pos_timer.timeout.connect(self._flush_position)
         self.player.durationChanged.connect(self._on_duration_changed)
+        self.player.playbackStateChanged.connect(self._arm_prefetch_timer)
 
         # Global sort state (persisted)
         self.sort_col: Optional[int] = None
@@ -152,30 +158,66 @@ class MyPlayerMain(
 
         # --- Search infra / overlays ----------------------------------------------
         self.search_pool = QThreadPool.globalInstance()
+        # Disk-bound jobs (startup load, missing-file scans) get their own pool
+        # so a long scan can't hold up searches on the global one.
+        self.io_pool = QThreadPool(self)
+        self.io_pool.setMaxThreadCount(min(8, os.cpu_count() or 4))
         self._search_seq = 0
-        self._last_search_seq = 0
         self._search_running = False
+        self._search_started = 0.0
         self.busy = BusyOverlay(self, "Searching…")
         self.empty_hint = EmptyHint(self, "No result found")
 
         # "no results" overlay on the table viewport
         self.no_results_hint = QLabel("No results found")
         self.no_results_hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.no_results_hint.setStyleSheet("color:#98a2b3; font-size:14px;")
+        self.no_results_hint.setObjectName("NoResultsHint")
         self.no_results_hint.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         self.no_results_hint.hide()
 
-        # --- Build UI and restore persisted state ----------------------------------
+        # --- Build UI, then load library/caches off the UI thread -------------------
         self._build_ui()
-        self._load_state()
-        self._refresh_categories()
-        self._refresh_playlists_panel()
-        self._rebuild_playlists_menu()
-        self._rebuild_suggestions_menu()
-        self._sync_view_label_from_state()
-
-        # Render first view immediately; DO NOT start any background downloads here.
-        self._apply_search_now()
+        self._rename_task = None  # RenameCategoryTask in flight (one rename at a time)
+        # Show the previous run's top rows while loading; the veil would hide them
+        if self._paint_last_view():
+            self.status.showMessage("Loading library…")
+        else:
+            self._set_busy(True, "Loading library…")
+        # The overlay lets clicks through: keep every control and menu inert until
+        # the saved state is loaded, so nothing can save the still-empty state over it.
+        self.centralWidget().setEnabled(False)
+        self.menuBar().setEnabled(False)
+        self._initial_load_task = InitialLoadTask()
+        self._initial_load_task.signals.done.connect(self._on_initial_load)
+        self.io_pool.start(self._initial_load_task)
+
+    def _on_initial_load(self, library, duration_db, history, custom_urls, search_index) -> None:
+        """InitialLoadTask finished: adopt the data and render the first view."""
+        self._initial_load_task = None
+        self.library = library
+        self._search_index_cache = search_index
+        self.duration_db = duration_db
+        self.history.update(history)
+        self.custom_urls.update(custom_urls)
+
+        # Restore state and fill every panel in one repaint instead of one per widget.
+        self.setUpdatesEnabled(False)
+        try:
+            # Restore persisted state (needs the library to validate the last category)
+            self._load_state()
+            self._refresh_categories()
+            self._refresh_playlists_panel()
+            self._rebuild_playlists_menu()
+            self._rebuild_suggestions_menu()
+            self._sync_view_label_from_state()
+
+            # Render first view immediately; DO NOT start any background downloads here.
+            self._apply_search_now()
+            self.status.clearMessage()
+        finally:
+            self.centralWidget().setEnabled(True)
+            self.menuBar().setEnabled(True)
+            self.setUpdatesEnabled(True)
 
     def _setup_app_window(self) -> None:
         self.setWindowTitle(APP_NAME)
@@ -200,15 +242,15 @@ class MyPlayerMain(
         self.playlist_list.customContextMenuRequested.connect(self._playlist_context_menu)
 
         left = QVBoxLayout()
-        lab1 = QLabel("Categories"); lab1.setStyleSheet("font-weight:600;")
-        lab2 = QLabel("Playlists");  lab2.setStyleSheet("font-weight:600; margin-top:8px;")
+        lab1 = QLabel("Categories"); lab1.setObjectName("SectionLabel")
+        lab2 = QLabel("Playlists");  lab2.setObjectName("PlaylistsSectionLabel")
         left.addWidget(lab1); left.addWidget(self.category_list, 1)
         left.addWidget(lab2); left.addWidget(self.playlist_list, 1)
         left_box = QWidget(); left_box.setLayout(left)
 
         # ---------- Right column: Search + Table + Controls ----------
         self.view_label = QLabel("Category: (none)")
-        self.view_label.setStyleSheet("font-weight:700; font-size:16px;")
+        self.view_label.setObjectName("ViewLabel")
 
         # Search row
         scope_line = QHBoxLayout()
@@ -222,15 +264,26 @@ class MyPlayerMain(
         scope_line.addWidget(self.scope_combo)
 
         # Debounced search
-        self.search_edit.textChanged.connect(lambda _: self._type_debounce.start())
+        self.search_edit.textChanged.connect(self._on_search_text_changed)
         self.scope_combo.currentIndexChanged.connect(lambda _: self._apply_search_now())
 
         # Results table
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(["★", "Category", "Song", "Film/Album", "Artists", "Duration"])
+        self.model = SongTableModel(
+            is_fav=lambda s: s.key() in self.favourites,
+            duration_text=self._duration_text,
+            duration_sec=self._duration_sort_sec,
+            parent=self,
+        )
+        self.model.cellEdited.connect(self._on_cell_edited)
+        self.table = QTableView()
+        # Configure with updates off: each setter below would otherwise
+        # schedule its own relayout/repaint of the table.
+        self.table.setUpdatesEnabled(False)
+        self.table.setModel(self.model)
         self.table.setShowGrid(False)
 
         hh = self.table.horizontalHeader()
+        hh.setStretchLastSection(False)
         hh.setSortIndicatorShown(True)
         hh.setSectionsClickable(True)
         hh.sectionClicked.connect(self._on_header_clicked)
@@ -243,14 +296,15 @@ class MyPlayerMain(
         hh.setSectionResizeMode(self.COL_DURATION, QHeaderView.ResizeMode.ResizeToContents)
 
         self.table.setColumnWidth(self.COL_FAV, 36)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.doubleClicked.connect(self._play_selected)
+        self.table.clicked.connect(self._on_table_clicked)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._table_context_menu)
 
-        # We sort the *data* then (re)render in batches; avoid built-in row-sorting here.
+        # Header clicks sort through SongTableModel.sort() (see _on_header_clicked), not the view.
         self.table.setSortingEnabled(False)
         self.table.setMouseTracking(True)
         self.table.setAutoScroll(False)
@@ -260,7 +314,11 @@ class MyPlayerMain(
         self.row_delegate = MaterialRowDelegate(self)
         self.table.setItemDelegate(self.row_delegate)
         self.table.setAlternatingRowColors(False)
-        self.table.setStyleSheet(self.table.styleSheet() + " QTableWidget::item { padding: 6px; } ")
+
+        # Fixed row height: the view never has to measure off-screen rows.
+        vh = self.table.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vh.setDefaultSectionSize(32)
 
         # Empty / no-results overlay tied to the table viewport
         self.no_results_hint.setParent(self.table.viewport())
@@ -271,10 +329,12 @@ class MyPlayerMain(
         if self.sort_col is None:
             self.sort_col = self.COL_TITLE
             self.sort_asc = True
-        hh.setSortIndicator(
-            self.sort_col,
-            Qt.SortOrder.AscendingOrder if self.sort_asc else Qt.SortOrder.DescendingOrder
-        )
+        with QSignalBlocker(hh):
+            hh.setSortIndicator(
+                self.sort_col,
+                Qt.SortOrder.AscendingOrder if self.sort_asc else Qt.SortOrder.DescendingOrder
+            )
+        self.table.setUpdatesEnabled(True)
 
         # Playback seek + clock
         self.seek = SeekSlider(Qt.Orientation.Horizontal)
@@ -354,18 +414,17 @@ class MyPlayerMain(
         # Menus
         menubar = self.menuBar()
         m_file = menubar.addMenu("&File")
-        m_file.setStyleSheet(MaterialTheme.stylesheet())
         m_file.addAction(QAction("Reload CSVs", self, triggered=self._reload_csvs))
         m_file.addAction(QAction("Exit", self, triggered=self.close))
 
         self.m_playlists = menubar.addMenu("&Playlists")
-        self.m_playlists.setStyleSheet(MaterialTheme.stylesheet())
         self.act_show_fav = QAction("Favourites", self, triggered=self._show_favourites)
         self.m_playlists.addAction(self.act_show_fav)
         self.m_playlists.addSeparator()
+        # {playlist name: its menu action}, kept in sync by _rebuild_playlists_menu()
+        self._pl_menu_actions: Dict[str, QAction] = {}
 
         self.m_suggest = menubar.addMenu("&Suggestions")
-        self.m_suggest.setStyleSheet(MaterialTheme.stylesheet())
         self.m_suggest.addAction(QAction("Show Top Suggestions", self, triggered=self._show_suggestions))
 
         # Busy overlay tied to the window
@@ -388,3 +447,10 @@ class MyPlayerMain(
     def resizeEvent(self, e):
         super().resizeEvent(e)
         if self.busy: self.busy.setGeometry(self.rect())
+
+    def closeEvent(self, e):
+        # Persist the view as it is on exit (next launch paints it first);
+        # _save_state() skips it while the initial load is still pending.
+        self._state_save_timer.stop()
+        self._save_state()
+        super().closeEvent(e)
@@ -1,6 +1,6 @@
 from typing import List
 
-from PyQt6.QtCore import pyqtSlot, QThreadPool
+from PyQt6.QtCore import pyqtSlot
 
 from my_player.signals.missing_task import ScanMissingTask
 from my_player.models.song import Song
@@ -12,7 +12,7 @@ class BackgroundScanMixin:
         self.status.showMessage("Scanning library for missing files…", 2000)
         task = ScanMissingTask(self.library)
         task.signals.done.connect(self._on_missing_scanned)
-        QThreadPool.globalInstance().start(task)
+        self.io_pool.start(task)
 
     @pyqtSlot(list)
     def _on_missing_scanned(self, missing: List[Song]):
@@ -1,6 +1,7 @@
+from functools import partial
 from typing import Dict, List, Tuple
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
     QMenu,
@@ -11,16 +12,13 @@ from PyQt6.QtWidgets import (
 from my_player.helpers.ui_utils import themed_msg
 from my_player.helpers.db_utils import save_dur_db
 from my_player.helpers.file_utils import expected_path
-from my_player.helpers.constants import (
-    SPECIAL_FAV_CATEGORY,
-    SPECIAL_PL_CATEGORY_PREFIX
-)
+from my_player.helpers.utils import parse_artists
+from my_player.helpers.constants import SPECIAL_PL_CATEGORY_PREFIX
 from my_player.io.library_io import (
     load_library_from_csvs,
     append_rows_to_category_csv,
-    rename_category_everywhere
 )
-from my_player.ui.theme import MaterialTheme
+from my_player.signals.rename_task import RenameCategoryTask
 from my_player.ui.dialogs.add_category_dialog import AddCategoryDialog
 from my_player.models.song import Song
 
@@ -40,18 +38,48 @@ class CategoryPlaylistMixin:
     # --- Categories / Playlists panels ------------------------------------
 
     def _refresh_categories(self) -> None:
-        """Rebuild the Categories list widget from self.library."""
-        self.category_list.clear()
+        """
+        Rebuild the Categories list widget from self.library.
+
+        Signals are blocked: re-selecting the current category is not a user
+        selection and must not re-enter _on_cat_selected (save + re-render);
+        callers refresh the view themselves.
+        """
         cats = sorted(self.library.keys())
-        self.category_list.addItems(cats)
+        self._refill_list(self.category_list, cats)
 
         if self.current_category and self.current_category in cats:
-            self.category_list.setCurrentRow(cats.index(self.current_category))
+            with QSignalBlocker(self.category_list):
+                self.category_list.setCurrentRow(cats.index(self.current_category))
 
     def _refresh_playlists_panel(self) -> None:
         """Rebuild the Playlists list widget from self.playlists."""
-        self.playlist_list.clear()
-        self.playlist_list.addItems(sorted(self.playlists.keys()))
+        self._refill_list(self.playlist_list, self._sorted_playlists())
+
+    @staticmethod
+    def _refill_list(w, names: List[str]) -> None:
+        """
+        Make a QListWidget show `names` (sorted) by removing / inserting only
+        the entries that changed, with one relayout/repaint and no signals.
+        """
+        current = [w.item(i).text() for i in range(w.count())]
+        if current == names:
+            return
+
+        target = set(names)
+        w.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(w):
+                for i in range(len(current) - 1, -1, -1):
+                    if current[i] not in target:
+                        w.takeItem(i)
+                # Survivors keep their sorted order, so each new name goes in at its final row
+                kept = target.intersection(current)
+                for i, name in enumerate(names):
+                    if name not in kept:
+                        w.insertItem(i, name)
+        finally:
+            w.setUpdatesEnabled(True)
 
     def _on_cat_selected(self) -> None:
         """Triggered when user selects a category in the left pane."""
@@ -59,7 +87,7 @@ class CategoryPlaylistMixin:
         if not items:
             return
 
-        self.current_category = items[0].text()
+        self._set_current_category(items[0].text())
         self.playlist_list.clearSelection()
         self._sync_view_label_from_state()
         self._save_state()
@@ -72,14 +100,13 @@ class CategoryPlaylistMixin:
             return
 
         name = items[0].text()
-        self.current_category = f"{SPECIAL_PL_CATEGORY_PREFIX}{name}"
+        self._set_current_category(f"{SPECIAL_PL_CATEGORY_PREFIX}{name}")
         self.category_list.clearSelection()
         self._sync_view_label_from_state()
         self._save_state()
 
-        self._set_busy(True, "Rendering results…")
         base = self._songs_from_keys(self.playlists.get(name, []))
-        self._populate_table_async(base)
+        self._show_songs(base)
 
     # --- View label / title ----------------------------------------------
 
@@ -90,15 +117,15 @@ class CategoryPlaylistMixin:
 
     def _sync_view_label_from_state(self) -> None:
         """Update label based on current_category (fav/playlist/category/none)."""
-        if self.current_category == SPECIAL_FAV_CATEGORY:
+        kind, name = self._view_kind, self._view_name
+        if kind == "favourites":
             self._set_view_label("Favourites")
             self.remove_pl_sel_btn.setVisible(False)
-        elif self.current_category and self.current_category.startswith(SPECIAL_PL_CATEGORY_PREFIX):
-            name = self.current_category[len(SPECIAL_PL_CATEGORY_PREFIX):]
+        elif kind == "playlist":
             self._set_view_label(f"Playlist: {name}")
             self.remove_pl_sel_btn.setVisible(True)
-        elif self.current_category:
-            self._set_view_label(f"Category: {self.current_category}")
+        elif name:
+            self._set_view_label(f"Category: {name}")
             self.remove_pl_sel_btn.setVisible(False)
         else:
             self._set_view_label("Category: (none)")
@@ -108,7 +135,7 @@ class CategoryPlaylistMixin:
 
     def _open_category(self, name: str) -> None:
         """Open a given category in the main view."""
-        self.current_category = name
+        self._set_current_category(name)
         self.category_list.clearSelection()
         items = self.category_list.findItems(name, Qt.MatchFlag.MatchExactly)
         if items:
@@ -126,13 +153,12 @@ class CategoryPlaylistMixin:
 
         name = item.text()
         menu = QMenu(self)
-        menu.setStyleSheet(MaterialTheme.stylesheet())
-        menu.addAction(QAction("Open", self, triggered=lambda: self._open_category(name)))
+        menu.addAction(QAction("Open", self, triggered=partial(self._open_category, name)))
         menu.addAction(
             QAction(
                 "Rename…",
                 self,
-                triggered=lambda: self._rename_category_or_playlist(name),
+                triggered=partial(self._rename_category_or_playlist, name),
             )
         )
         menu.exec(self.category_list.mapToGlobal(pos))
@@ -144,15 +170,15 @@ class CategoryPlaylistMixin:
 
         name = item.text()
         menu = QMenu(self)
-        menu.setStyleSheet(MaterialTheme.stylesheet())
 
-        menu.addAction(QAction("Open", self, triggered=lambda: self._open_playlist(name)))
+        menu.addAction(QAction("Open", self, triggered=partial(self._open_playlist, name)))
         menu.addAction(
             QAction(
                 "Rename…",
                 self,
-                triggered=lambda: self._rename_category_or_playlist(
-                    f"{SPECIAL_PL_CATEGORY_PREFIX}{name}"
+                triggered=partial(
+                    self._rename_category_or_playlist,
+                    f"{SPECIAL_PL_CATEGORY_PREFIX}{name}",
                 ),
             )
         )
@@ -170,10 +196,11 @@ class CategoryPlaylistMixin:
             )
             if box.exec() == QMessageBox.StandardButton.Yes:
                 self.playlists.pop(name, None)
+                self._sorted_playlist_names = None
                 self._save_state()
                 self._refresh_playlists_panel()
                 if self.current_category == f"{SPECIAL_PL_CATEGORY_PREFIX}{name}":
-                    self.current_category = None
+                    self._set_current_category(None)
                     self._apply_search_now()
 
         menu.addAction(QAction("Delete…", self, triggered=_delete))
@@ -188,7 +215,7 @@ class CategoryPlaylistMixin:
         - For playlists, only in-memory mapping + state are updated.
         - For categories, CSV files + library + favourites + playlists +
           history + duration cache + custom URLs are remapped using
-          rename_category_everywhere(..).
+          rename_category_everywhere(..), which runs as a RenameCategoryTask.
         """
         # ---- Playlist path ----
         if isinstance(name_or_prefixed, str) and name_or_prefixed.startswith(
@@ -226,11 +253,12 @@ class CategoryPlaylistMixin:
                 return
 
             self.playlists[new_pl] = self.playlists.pop(old_pl)
+            self._sorted_playlist_names = None
             self._save_state()
             self._rebuild_playlists_menu()
 
             if self.current_category == f"{SPECIAL_PL_CATEGORY_PREFIX}{old_pl}":
-                self.current_category = f"{SPECIAL_PL_CATEGORY_PREFIX}{new_pl}"
+                self._set_current_category(f"{SPECIAL_PL_CATEGORY_PREFIX}{new_pl}")
                 self._sync_view_label_from_state()
                 self._apply_search_now()
 
@@ -238,6 +266,10 @@ class CategoryPlaylistMixin:
             return
 
         # ---- Category path ----
+        if self._rename_task is not None:
+            self.status.showMessage("A category rename is still in progress.", 2500)
+            return
+
         old_cat = name_or_prefixed
         if not old_cat or old_cat not in self.library:
             themed_msg(
@@ -269,33 +301,67 @@ class CategoryPlaylistMixin:
             ).exec()
             return
 
-        # IO + mapping
-        try:
-            moved_pairs: List[Tuple[Tuple[str, str, str, str], Tuple[str, str, str, str]]] = (
-                rename_category_everywhere(old_cat, new_cat, self.library)
-            )
-        except Exception as e:
-            themed_msg(
-                self,
-                QMessageBox.Icon.Critical,
-                "Rename failed",
-                f"{e}",
-            ).exec()
-            return
-
-        # Reload library to reflect new CSVs + categories
-        self.library = load_library_from_csvs()
-
-        # --- Favourites remap ---
-        if getattr(self, "favourites", None):
-            conv = dict(moved_pairs)
+        # File IO (CSV rename + moving downloads) runs on the I/O pool;
+        # the in-memory remap finishes in _apply_rename_post_io on the UI thread.
+        self._set_busy(True, "Renaming…")
+        task = RenameCategoryTask(old_cat, new_cat, self.library)
+        task.signals.done.connect(self._apply_rename_post_io)
+        task.signals.failed.connect(self._on_rename_failed)
+        self._rename_task = task
+        self.io_pool.start(task)
+
+    def _on_rename_failed(self, err: str) -> None:
+        self._rename_task = None
+        self._set_busy(False)
+        themed_msg(
+            self,
+            QMessageBox.Icon.Critical,
+            "Rename failed",
+            err,
+        ).exec()
+
+    def _apply_rename_post_io(
+        self,
+        old_cat: str,
+        new_cat: str,
+        moved_pairs: List[Tuple[Tuple[str, str, str, str], Tuple[str, str, str, str]]],
+    ) -> None:
+        """
+        RenameCategoryTask finished: remap library, favourites, playlists,
+        history, duration cache and custom URLs to the new keys, then refresh.
+        """
+        self._rename_task = None
+        self._set_busy(False)
+
+        # Patch the library in place instead of re-parsing every CSV: only this
+        # category's rows changed, and only their category field
+        # (skipped if a CSV reload already picked up the renamed file meanwhile)
+        songs = self.library.pop(old_cat, None)
+        if songs is not None:
+            for song in songs:
+                song.category = new_cat
+                song.invalidate()
+            self.library[new_cat] = songs
+        # Same library object, so drop the lookups built over the old keys
+        self._song_index_cache = None
+        self._search_index_cache = None
+
+        # Old -> new key maps, built once for every remap below:
+        # tuple keys (favourites, playlists), "||" keys (history, custom URLs),
+        # "|" keys (duration cache)
+        conv = dict(moved_pairs)
+        conv_hist = {"||".join(ok): "||".join(nk) for ok, nk in moved_pairs}
+        conv_dur = {"|".join(ok): "|".join(nk) for ok, nk in moved_pairs}
+
+        # --- Favourites remap (skipped when none of them moved) ---
+        if getattr(self, "favourites", None) and not self.favourites.isdisjoint(conv):
             self.favourites = {conv.get(k, k) for k in self.favourites}
 
-        # --- Playlists remap ---
+        # --- Playlists remap (only playlists holding a moved song are rebuilt) ---
         if getattr(self, "playlists", None):
-            conv = dict(moved_pairs)
             for pl_name, lst in list(self.playlists.items()):
-                self.playlists[pl_name] = [conv.get(k, k) for k in lst]
+                if not conv.keys().isdisjoint(lst):
+                    self.playlists[pl_name] = [conv.get(k, k) for k in lst]
 
         # --- Last/current keys & current_category ---
         if getattr(self, "last_song_key", None) and self.last_song_key[0] == old_cat:
@@ -315,48 +381,51 @@ class CategoryPlaylistMixin:
             )
 
         if self.current_category == old_cat:
-            self.current_category = new_cat
+            self._set_current_category(new_cat)
             self._sync_view_label_from_state()
 
         # --- History remap ---
+        # (in place: DownloadManager shares history / custom_urls by reference)
         if getattr(self, "history", None):
-            conv_hist = {"||".join(ok): "||".join(nk) for ok, nk in moved_pairs}
-            self.history = {conv_hist.get(k, k): v for k, v in self.history.items()}
+            remapped = {conv_hist.get(k, k): v for k, v in self.history.items()}
+            self.history.clear()
+            self.history.update(remapped)
 
         # --- Duration cache remap (song-key + path-key) ---
         if getattr(self, "duration_db", None):
-            conv_dur = {"|".join(ok): "|".join(nk) for ok, nk in moved_pairs}
             new_db: Dict[str, int] = {
                 conv_dur.get(k, k): v for k, v in self.duration_db.items()
             }
 
-            # Seed path-keys for renamed songs
+            # Seed path-keys for renamed songs (only those with a cached duration
+            # need a Song / expected_path), applied in one update
+            seeds: Dict[str, int] = {}
             for _, nk in moved_pairs:
+                k_song = "|".join(nk)
+                if k_song not in new_db:
+                    continue
                 s_new = Song(
                     category=nk[0],
                     title=nk[1],
                     album=nk[2],
-                    artists=[
-                        x.strip()
-                        for x in nk[3].split(",")
-                        if x.strip()
-                    ],
+                    artists=parse_artists(nk[3]),
                 )
-                p_new = expected_path(s_new)
-                k_song = "|".join(nk)
-                if k_song in new_db and str(p_new) not in new_db:
-                    new_db[str(p_new)] = new_db[k_song]
+                p_new = str(expected_path(s_new))
+                if p_new not in new_db:
+                    seeds[p_new] = new_db[k_song]
+            new_db.update(seeds)
 
             self.duration_db = new_db
             save_dur_db(self.duration_db)
 
         # --- Custom URLs remap (exact keys only, leave *|| wildcards alone) ---
         if getattr(self, "custom_urls", None):
-            conv_urls = {"||".join(ok): "||".join(nk) for ok, nk in moved_pairs}
-            self.custom_urls = {
-                (conv_urls.get(k, k) if not k.startswith("*||") else k): v
+            remapped = {
+                (conv_hist.get(k, k) if not k.startswith("*||") else k): v
                 for k, v in self.custom_urls.items()
             }
+            self.custom_urls.clear()
+            self.custom_urls.update(remapped)
 
         # --- Refresh UI ---
         self._refresh_categories()
@@ -414,18 +483,7 @@ class CategoryPlaylistMixin:
         - ("category", category)   → normal category
         - ("category", "")         → no category selected
         """
-        if self.current_category == SPECIAL_FAV_CATEGORY:
-            return "favourites", ""
-
-        if self.current_category and self.current_category.startswith(
-            SPECIAL_PL_CATEGORY_PREFIX
-        ):
-            return "playlist", self.current_category[len(SPECIAL_PL_CATEGORY_PREFIX):]
-
-        if self.current_category:
-            return "category", self.current_category
-
-        return "category", ""
+        return self._view_kind, self._view_name
 
     def _base_list_for_current_view(self) -> List[Song]:
         """
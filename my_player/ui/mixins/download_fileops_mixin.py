@@ -1,18 +1,17 @@
 from typing import List
 
-from PyQt6.QtCore import pyqtSlot, Qt
+from PyQt6.QtCore import QTimer, pyqtSlot
 from PyQt6.QtWidgets import (
-    QTableWidgetItem,
     QMessageBox,
     QInputDialog
 )
 
 from my_player.helpers.ui_utils import themed_msg
-from my_player.helpers.db_utils import save_dur_db
+from my_player.helpers.db_utils import delete_durations
 from my_player.helpers.file_utils import resolve_existing_file
+from my_player.helpers.scan_cache import scan_missing
 from my_player.helpers.player_history_utils import key_str
 from my_player.models.song import Song
-from my_player.io.library_io import expected_path
 
 
 class DownloadFileOpsMixin:
@@ -41,7 +40,7 @@ class DownloadFileOpsMixin:
         self.duration_db                 # Dict[str, int]
         self.custom_urls                 # Dict[str, str]
         self.history                     # Dict[str, dict]
-        self.table                       # QTableWidget
+        self.table                       # QTableView
         self.status                      # QStatusBar
         self.dl_status                   # QLabel
         self.favourites                  # set[Tuple[str,str,str,str]]
@@ -50,6 +49,7 @@ class DownloadFileOpsMixin:
         self._prefetch_next_key          # Optional[Tuple[str,str,str,str]]
         self._pending_autoplay_key       # Optional[Tuple[str,str,str,str]]
         self._deferred_hi: Deque[Tuple[Song, bool]]
+        self._hi_flush_pending: bool
 
       Methods:
         self._save_state()
@@ -63,7 +63,7 @@ class DownloadFileOpsMixin:
         self._sync_view_label_from_state()
         self._refresh_categories()
         self._rebuild_playlists_menu()
-        self._populate_table_async(songs: List[Song])
+        self._show_songs(songs: List[Song])
         self._resume_background_missing()   # defined in this mixin, but called by others
     """
 
@@ -103,16 +103,7 @@ class DownloadFileOpsMixin:
         Return the list of songs for which expected_path(song) does not exist.
         Pure library scan, no UI.
         """
-        out: List[Song] = []
-        for rows in self.library.values():
-            for s in rows:
-                try:
-                    if not expected_path(s).exists():
-                        out.append(s)
-                except Exception:
-                    # In case of weird path errors, just skip
-                    pass
-        return out
+        return scan_missing(self.library)
 
     def _resume_background_missing(self) -> None:
         """
@@ -166,7 +157,7 @@ class DownloadFileOpsMixin:
             if getattr(self, "_prefetch_in_progress", False) and self._prefetch_next_key == k:
                 self._prefetch_in_progress = False
                 self._prefetch_next_key = None
-                self._drain_deferred_if_idle()
+                self._schedule_deferred_flush()
 
             self.table.viewport().update()
         else:
@@ -179,15 +170,30 @@ class DownloadFileOpsMixin:
         # high-priority queue or background missing downloads.
         if not self.dlm.has_high_running():
             if self._deferred_hi:
-                self._drain_deferred_if_idle()
+                self._schedule_deferred_flush()
             elif not getattr(self, "_prefetch_in_progress", False):
                 self._resume_background_missing()
 
     # Helper to drain queued high-priority jobs once downloads are idle
+    def _schedule_deferred_flush(self) -> None:
+        """
+        Coalesce drain requests: a burst of pushes / completions in one
+        event-loop pass schedules a single _flush_deferred_hi.
+        """
+        if not self._hi_flush_pending:
+            self._hi_flush_pending = True
+            QTimer.singleShot(0, self._flush_deferred_hi)
+
+    def _flush_deferred_hi(self) -> None:
+        self._hi_flush_pending = False
+        self._drain_deferred_if_idle()
+
     def _drain_deferred_if_idle(self) -> None:
         """
         Called when high-priority queue becomes idle.
-        Schedules next queued high-priority job if any.
+        Schedules the next queued high-priority job, one per idle pass: the
+        rest wait for its completion (has_high_running() only sees jobs still
+        waiting in the queue, so it can't tell whether a worker picked it up).
         """
         if (
             not self.dlm.has_high_running()
@@ -238,24 +244,11 @@ class DownloadFileOpsMixin:
             fpath.unlink(missing_ok=True)
 
             # Purge duration cache under BOTH keys: logical song-key and file path
-            k_song = "|".join(s.key())
+            k_song = s.cache_key
             if hasattr(self, "duration_db") and isinstance(self.duration_db, dict):
                 self.duration_db.pop(k_song, None)
                 self.duration_db.pop(str(fpath), None)
-                save_dur_db(self.duration_db)
-
-            # Clear Duration cell in table (if visible)
-            for r, row_s in enumerate(getattr(self, "current_list", [])):
-                if (
-                    row_s.title == s.title
-                    and row_s.album == s.album
-                    and row_s.category == s.category
-                    and row_s.artists == s.artists
-                ):
-                    it = QTableWidgetItem("")
-                    it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.table.setItem(r, self.COL_DURATION, it)
-                    break
+                delete_durations(k_song, str(fpath))
 
             self.status.showMessage("Deleted file.", 3000)
         except Exception as e:
@@ -287,6 +280,7 @@ class DownloadFileOpsMixin:
             and getattr(self, "_prefetch_next_key", None) != s.key()
         ):
             self._deferred_hi.append((s, True))
+            self._schedule_deferred_flush()
             self.status.showMessage(
                 f"Queued refresh after current prefetch: {s.title}",
                 2500,
@@ -315,7 +309,7 @@ class DownloadFileOpsMixin:
           - base key:   *||title||album||artists
         """
         k_exact = key_str(s.key())
-        k_base = key_str(("*", s.title, s.album, ", ".join(s.artists)))
+        k_base = key_str(("*", s.title, s.album, s.artists_str))
 
         existing = self.custom_urls.get(k_exact, self.custom_urls.get(k_base, ""))
 
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Dict, List, Tuple
 
 from PyQt6.QtCore import Qt
@@ -13,7 +14,6 @@ from my_player.helpers.constants import (
 )
 from my_player.helpers.ui_utils import themed_msg
 from my_player.models.song import Song
-from my_player.ui.theme import MaterialTheme
 
 
 class FavouritesPlaylistsMixin:
@@ -29,11 +29,14 @@ class FavouritesPlaylistsMixin:
           self.library: Dict[str, List[Song]]
           self.favourites: set[Tuple[str,str,str,str]]
           self.playlists: Dict[str, List[Tuple[str,str,str,str]]]
+          self._sorted_playlist_names: Optional[List[str]]
           self.current_category: str | None
           self.current_list: List[Song]
           self.history: Dict[str, dict]
           self.table
+          self.model
           self.m_playlists
+          self._pl_menu_actions: Dict[str, QAction]
           self.m_suggest
           self.remove_pl_sel_btn
           self.status
@@ -43,7 +46,7 @@ class FavouritesPlaylistsMixin:
           self._sync_view_label_from_state()
           self._apply_search_now()
           self._set_busy(on: bool, text: str = "Working…")
-          self._populate_table_async(songs: List[Song])
+          self._show_songs(songs: List[Song])
           self._songs_from_keys(keys: List[Tuple[str,str,str,str]]) -> List[Song]
     """
 
@@ -66,36 +69,20 @@ class FavouritesPlaylistsMixin:
             self._save_state()
             self.status.showMessage("Added to favourites.", 2000)
 
+    def _on_table_clicked(self, index) -> None:
+        """A click on the "★/☆" column toggles that row's favourite."""
+        if index.column() == self.COL_FAV:
+            s = self.model.song_at(index.row())
+            if s is not None:
+                self._toggle_favourite_from_button(s)
+
     def _toggle_favourite_from_button(self, s: Song) -> None:
         """
-        Toggle favourite for the song and refresh the "★/☆" button
+        Toggle favourite for the song and refresh the "★/☆" cell
         in any visible row that matches this song.
         """
         self._toggle_favourite(s)
-
-        for r in range(self.table.rowCount()):
-            title_item = self.table.item(r, self.COL_TITLE)
-            album_item = self.table.item(r, self.COL_ALBUM)
-            artists_item = self.table.item(r, self.COL_ARTISTS)
-            category_item = self.table.item(r, self.COL_CATEGORY)
-
-            t = title_item.text() if title_item else ""
-            a = album_item.text() if album_item else ""
-            ar = artists_item.text() if artists_item else ""
-            c = category_item.text() if category_item else ""
-
-            if (
-                t == s.title
-                and a == s.album
-                and ar == ", ".join(s.artists)
-                and c == s.category
-            ):
-                btn = self.table.cellWidget(r, self.COL_FAV)
-                from PyQt6.QtWidgets import QPushButton, QToolButton
-
-                if isinstance(btn, (QPushButton, QToolButton)):
-                    btn.setText("★" if s.key() in self.favourites else "☆")
-                break
+        self.model.refresh_song(s)
 
     def _toggle_favourite(self, s: Song) -> None:
         """
@@ -113,14 +100,13 @@ class FavouritesPlaylistsMixin:
 
     def _show_favourites(self) -> None:
         """Switch view to 'Favourites' pseudo-category."""
-        self.current_category = SPECIAL_FAV_CATEGORY
+        self._set_current_category(SPECIAL_FAV_CATEGORY)
         self.category_list.clearSelection()
         self.playlist_list.clearSelection()
         self._sync_view_label_from_state()
 
         fav_songs = self._songs_from_keys(list(self.favourites))
-        self._set_busy(True, "Rendering results…")
-        self._populate_table_async(fav_songs)
+        self._show_songs(fav_songs)
         self._save_state()
 
     # ------------------------------------------------------------------
@@ -129,33 +115,53 @@ class FavouritesPlaylistsMixin:
 
     def _rebuild_playlists_menu(self) -> None:
         """
-        Rebuild the 'Playlists' top menu (keeps the first two actions:
-        'Favourites' + separator).
+        Sync the 'Playlists' top menu with self.playlists (after the first two
+        actions: 'Favourites' + separator). Only playlists that were added or
+        removed since the last sync touch the menu; entries stay sorted.
         """
-        actions = self.m_playlists.actions()
-        for act in actions[2:]:
+        acts = self._pl_menu_actions
+        for name in [n for n in acts if n not in self.playlists]:
+            act = acts.pop(name)
             self.m_playlists.removeAction(act)
+            act.deleteLater()
 
-        for name in sorted(self.playlists.keys()):
-            self.m_playlists.addAction(
-                QAction(
-                    name,
-                    self,
-                    triggered=lambda _, n=name: self._open_playlist(n),
-                )
+        added = [n for n in self.playlists if n not in acts]
+        if not added:
+            return
+        for name in added:
+            acts[name] = QAction(
+                name,
+                self,
+                triggered=partial(self._open_playlist, name),
             )
 
+        # Walk backwards so each new action goes in front of its (already placed) successor
+        before = None
+        for name in sorted(acts, reverse=True):
+            act = acts[name]
+            if name in added:
+                if before is None:
+                    self.m_playlists.addAction(act)
+                else:
+                    self.m_playlists.insertAction(before, act)
+            before = act
+
+    def _sorted_playlists(self) -> List[str]:
+        """Playlist names in display order (cached until a playlist is added/removed/renamed)."""
+        if self._sorted_playlist_names is None:
+            self._sorted_playlist_names = sorted(self.playlists)
+        return self._sorted_playlist_names
+
     def _open_playlist(self, name: str) -> None:
         """
         Open a playlist (as a pseudo-category) in the main view.
         """
-        self.current_category = f"{SPECIAL_PL_CATEGORY_PREFIX}{name}"
+        self._set_current_category(f"{SPECIAL_PL_CATEGORY_PREFIX}{name}")
         self.category_list.clearSelection()
         self.playlist_list.clearSelection()
         self._sync_view_label_from_state()
 
-        self._set_busy(True, "Rendering results…")
-        self._populate_table_async(self._songs_from_keys(self.playlists.get(name, [])))
+        self._show_songs(self._songs_from_keys(self.playlists.get(name, [])))
         self._save_state()
 
     def _add_song_to_existing_playlist_safe(self, s: Song, name: str) -> None:
@@ -163,6 +169,8 @@ class FavouritesPlaylistsMixin:
         Add a song to an existing playlist, prompting if already present.
         """
         k = s.key()
+        if name not in self.playlists:
+            self._sorted_playlist_names = None
         lst = self.playlists.setdefault(name, [])
 
         if k in lst:
@@ -171,7 +179,6 @@ class FavouritesPlaylistsMixin:
             box.setIcon(QMessageBox.Icon.Information)
             box.setTextFormat(Qt.TextFormat.PlainText)
             box.setText(f"“{s.title}” already exists in playlist “{name}”.")
-            box.setStyleSheet(MaterialTheme.stylesheet())
 
             add_btn = box.addButton("Add anyway", QMessageBox.ButtonRole.AcceptRole)
             skip_btn = box.addButton("Skip", QMessageBox.ButtonRole.RejectRole)
@@ -212,25 +219,30 @@ class FavouritesPlaylistsMixin:
         Resolve (category, title, album, artists_str) keys to Song instances
         from the in-memory library.
         """
+        index = self._song_index()
         res: List[Song] = []
-        index: Dict[str, Dict[Tuple[str, str, str], Song]] = {}
-
-        # Build a small lookup {category: {(title, album, artists_str): Song}}
-        for cat, rows in self.library.items():
-            m: Dict[Tuple[str, str, str], Song] = {}
-            for s in rows:
-                m[(s.title, s.album, ", ".join(s.artists))] = s
-            index[cat] = m
-
-        # Resolve each key
         for k in keys:
-            cat, title, album, artists_str = k
-            s = index.get(cat, {}).get((title, album, artists_str))
+            s = index.get(tuple(k))
             if s:
                 res.append(s)
 
         return res
 
+    def _song_index(self) -> Dict[Tuple[str, str, str, str], Song]:
+        """
+        Lookup {song.key(): Song} over the in-memory library.
+
+        Built once per library object and reused until self.library is
+        replaced (reload, edit, add category), so favourites / playlist /
+        suggestion views don't re-key every song on each open.
+        """
+        index = getattr(self, "_song_index_cache", None)
+        if index is None or getattr(self, "_song_index_src", None) is not self.library:
+            index = {s.key(): s for rows in self.library.values() for s in rows}
+            self._song_index_cache = index
+            self._song_index_src = self.library
+        return index
+
     def _remove_from_playlist(self, s: Song, playlist_name: str) -> None:
         """
         Remove a song from a specific playlist (if present).
@@ -242,8 +254,7 @@ class FavouritesPlaylistsMixin:
             self._save_state()
 
             if self.current_category == f"{SPECIAL_PL_CATEGORY_PREFIX}{playlist_name}":
-                self._set_busy(True, "Rendering results…")
-                self._populate_table_async(self._songs_from_keys(lst))
+                self._show_songs(self._songs_from_keys(lst))
 
             self.status.showMessage(
                 f"Removed from playlist: {playlist_name}", 2500
@@ -253,13 +264,10 @@ class FavouritesPlaylistsMixin:
         """
         Remove selected rows from the *current* playlist view only.
         """
-        if not (
-            self.current_category
-            and self.current_category.startswith(SPECIAL_PL_CATEGORY_PREFIX)
-        ):
+        if self._view_kind != "playlist":
             return
 
-        playlist_name = self.current_category[len(SPECIAL_PL_CATEGORY_PREFIX):]
+        playlist_name = self._view_name
         rows = sorted({ix.row() for ix in self.table.selectedIndexes()})
         if not rows:
             themed_msg(
@@ -285,8 +293,7 @@ class FavouritesPlaylistsMixin:
 
         if changed:
             self._save_state()
-            self._set_busy(True, "Rendering results…")
-            self._populate_table_async(self._songs_from_keys(lst))
+            self._show_songs(self._songs_from_keys(lst))
             self.status.showMessage(
                 f"Removed {len(keys_to_remove)} song(s) from playlist: {playlist_name}",
                 3000,
@@ -1,7 +1,8 @@
-from PyQt6.QtWidgets import QTableWidgetItem, QMessageBox
+from PyQt6.QtWidgets import QMessageBox
 
 from my_player.models.song import Song
 from my_player.helpers.ui_utils import themed_msg
+from my_player.helpers.utils import parse_artists
 from my_player.io.library_io import load_library_from_csvs
 from my_player.io.persistence import update_song_row
 
@@ -13,7 +14,8 @@ class InlineEditMixin:
     Expects the main window to provide:
 
       Attributes:
-        self.table           # QTableWidget
+        self.table           # QTableView
+        self.model           # SongTableModel
         self.current_list    # List[Song]
         self.library         # Dict[str, List[Song]]
         self.status          # QStatusBar
@@ -34,25 +36,20 @@ class InlineEditMixin:
 
     def _enable_table_editing(self) -> None:
         """
-        Enable inline editing on specific columns and connect itemChanged
-        to _on_item_changed. Call this once during UI setup.
+        Enable inline editing on specific columns. Edits arrive through
+        SongTableModel.cellEdited → _on_cell_edited (connected in _build_ui).
+        Call this once during UI setup.
         """
         self.table.setEditTriggers(
             self.table.EditTrigger.DoubleClicked
             | self.table.EditTrigger.SelectedClicked
         )
-        try:
-            self.table.itemChanged.disconnect(self._on_item_changed)
-        except Exception:
-            pass
-        self.table.itemChanged.connect(self._on_item_changed)
 
-    def _on_item_changed(self, item: QTableWidgetItem) -> None:
+    def _on_cell_edited(self, r: int, c: int, text: str) -> None:
         """
         Persist edits to category / title / album / artists back to CSV via
         update_song_row(old, new). Mirrors original logic.
         """
-        r, c = item.row(), item.column()
         if not (0 <= r < len(self.current_list)):
             return
 
@@ -66,22 +63,16 @@ class InlineEditMixin:
 
         old = self.current_list[r]
 
-        # Read edited values from the row, falling back to old if missing.
-        cat_item = self.table.item(r, self.COL_CATEGORY)
-        tit_item = self.table.item(r, self.COL_TITLE)
-        alb_item = self.table.item(r, self.COL_ALBUM)
-        art_item = self.table.item(r, self.COL_ARTISTS)
-
-        new_cat = cat_item.text() if cat_item else old.category
-        new_t = tit_item.text() if tit_item else old.title
-        new_al = alb_item.text() if alb_item else old.album
-        new_ar_s = art_item.text() if art_item else ", ".join(old.artists)
+        new_cat = text if c == self.COL_CATEGORY else old.category
+        new_t = text if c == self.COL_TITLE else old.title
+        new_al = text if c == self.COL_ALBUM else old.album
+        new_ar_s = text if c == self.COL_ARTISTS else ", ".join(old.artists)
 
         new = Song(
             category=new_cat,
             title=new_t,
             album=new_al,
-            artists=[x.strip() for x in new_ar_s.split(",") if x.strip()],
+            artists=parse_artists(new_ar_s),
         )
 
         try:
@@ -91,11 +82,11 @@ class InlineEditMixin:
             # Reload library in memory and update current row object
             self.library = load_library_from_csvs()
             self.current_list[r] = new
+            self.model.refresh_row(r)
             self._refresh_categories()
             self.status.showMessage("Saved edit to CSV.", 2000)
 
         except Exception as e:
-            # On failure, restore original values in the table
             themed_msg(
                 self,
                 QMessageBox.Icon.Critical,
@@ -103,19 +94,5 @@ class InlineEditMixin:
                 f"{e}",
             ).exec()
 
-            self.table.blockSignals(True)
-            self.table.setItem(
-                r, self.COL_CATEGORY, QTableWidgetItem(old.category)
-            )
-            self.table.setItem(
-                r, self.COL_TITLE, QTableWidgetItem(old.title)
-            )
-            self.table.setItem(
-                r, self.COL_ALBUM, QTableWidgetItem(old.album)
-            )
-            self.table.setItem(
-                r,
-                self.COL_ARTISTS,
-                QTableWidgetItem(", ".join(old.artists)),
-            )
-            self.table.blockSignals(False)
+            # On failure, restore original values in the table
+            self.model.refresh_row(r)
@@ -2,19 +2,17 @@ from typing import List, Optional, Tuple
 from pathlib import Path
 
 from PyQt6.QtCore import (
-    Qt,
     QTimer,
     QEasingCurve,
     QAbstractAnimation,
     QPropertyAnimation,
     pyqtSlot
 )
-from PyQt6.QtWidgets import QTableWidgetItem
 from PyQt6.QtMultimedia import QMediaPlayer
 
 from my_player.helpers.constants import PREFETCH_MS
-from my_player.helpers.duration_utils import ms_to_mmss
-from my_player.helpers.db_utils import save_dur_db
+from my_player.helpers.duration_utils import ms_to_mmss, sec_from_cache_val
+from my_player.helpers.db_utils import set_durations
 from my_player.helpers.file_utils import resolve_existing_file
 from my_player.helpers.player_history_utils import key_str
 from my_player.models.song import Song
@@ -66,6 +64,8 @@ class PlayerQueueMixin:
           self._prefetch_triggered: bool
           self._prefetch_in_progress: bool
           self._prefetch_next_key: Optional[Tuple[str,str,str,str]]
+          self._prefetch_timer: QTimer  (single-shot → _start_next_prefetch)
+          self._state_save_timer: QTimer  (single-shot → _save_state)
           self._pending_autoplay_key: Optional[Tuple[str,str,str,str]]
           self._deferred_hi: "deque[Tuple[Song,bool]]"
       - helpers:
@@ -82,8 +82,8 @@ class PlayerQueueMixin:
     # ------------------------------------------------------------------
 
     def _play_selected(self) -> None:
-        row = self.table.currentRow()
-        if row < 0 and self.table.rowCount() > 0:
+        row = self.table.currentIndex().row()
+        if row < 0 and self.model.rowCount() > 0:
             row = 0
         if row >= 0:
             self._start_playback_from_row(row)
@@ -102,6 +102,7 @@ class PlayerQueueMixin:
         self._prefetch_in_progress = False
         self._prefetch_next_key = None
         self._pending_autoplay_key = None
+        self._prefetch_timer.stop()
 
         self.current_song_key = s.key()
 
@@ -151,7 +152,7 @@ class PlayerQueueMixin:
             return
 
         # Nothing loaded yet; decide what to play
-        if self.table.rowCount() == 0 or not self.current_list:
+        if self.model.rowCount() == 0 or not self.current_list:
             if not self.current_category:
                 # Try last category from state
                 if self.last_song_key:
@@ -166,11 +167,11 @@ class PlayerQueueMixin:
             return
 
         # Try to restore last song row
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0 and self.last_song_key and self.current_category == self.last_song_key[0]:
             row = self._select_row_for_song_key(self.last_song_key)
 
-        if row < 0 and self.table.rowCount() > 0:
+        if row < 0 and self.model.rowCount() > 0:
             row = 0
             self.table.selectRow(row)
 
@@ -186,16 +187,8 @@ class PlayerQueueMixin:
             return -1
 
         _, title, album, artists_str = k
-        for r in range(self.table.rowCount()):
-            t_item = self.table.item(r, self.COL_TITLE)
-            a_item = self.table.item(r, self.COL_ALBUM)
-            ar_item = self.table.item(r, self.COL_ARTISTS)
-
-            t = t_item.text() if t_item else ""
-            a = a_item.text() if a_item else ""
-            ar = ar_item.text() if ar_item else ""
-
-            if t == title and a == album and ar == artists_str:
+        for r, s in enumerate(self.model.rows()):
+            if s.title == title and s.album == album and s.artists_str == artists_str:
                 return r
 
         return -1
@@ -205,7 +198,7 @@ class PlayerQueueMixin:
         Change current_category and re-render, but skip list selection tweaks.
         Used when resuming from last song/category.
         """
-        self.current_category = name
+        self._set_current_category(name)
         self._sync_view_label_from_state()
         self._apply_search_now()
 
@@ -399,19 +392,36 @@ class PlayerQueueMixin:
 
     @pyqtSlot("qint64")
     def _on_pos_changed(self, pos_ms: int) -> None:
-        if not self._user_seeking:
-            self.seek.setValue(pos_ms)
-
+        """Keep the latest position; seek bar + clock repaint when _pos_timer fires."""
+        self._pos_pending_ms = pos_ms
+        if not self._pos_timer.isActive():
+            self._pos_timer.start()
+
+    def _flush_position(self) -> None:
+        # While dragging, the slider and clock show the seek preview instead
+        if self._user_seeking:
+            return
+        pos_ms = self._pos_pending_ms
+        self.seek.setValue(pos_ms)
         self.time_label.set_times(
             ms_to_mmss(pos_ms), ms_to_mmss(self._duration_ms)
         )
 
-        if (
-            self._duration_ms > 0
-            and (self._duration_ms - pos_ms) <= PREFETCH_MS
-            and not self._prefetch_triggered
-        ):
-            self._start_next_prefetch()
+    def _arm_prefetch_timer(self, *_args, position_ms: Optional[int] = None) -> None:
+        """
+        (Re)schedule the next-song prefetch for when PREFETCH_MS of playback
+        remain. Re-armed on duration change, play/pause and seek, so the
+        position ticks don't have to check it. `position_ms` overrides the
+        player's position (a seek target the backend may not report yet).
+        """
+        self._prefetch_timer.stop()
+        if self._prefetch_triggered or self._duration_ms <= 0:
+            return
+        if self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
+            return
+        pos = self.player.position() if position_ms is None else position_ms
+        remaining = self._duration_ms - pos
+        self._prefetch_timer.start(max(0, remaining - PREFETCH_MS))
 
     @pyqtSlot("qint64")
     def _on_duration_changed(self, dur_ms: int) -> None:
@@ -424,6 +434,7 @@ class PlayerQueueMixin:
         self.time_label.set_times(
             ms_to_mmss(self.player.position()), ms_to_mmss(self._duration_ms)
         )
+        self._arm_prefetch_timer()
 
         src = self.player.source()
         if src and src.isLocalFile() and dur_ms > 0:
@@ -431,22 +442,20 @@ class PlayerQueueMixin:
             secs = int(dur_ms // 1000)
 
             # Store under file-path key and logical song-key
-            self.duration_db[p] = secs
+            entries = {p: secs}
             if self.current_song_key:
-                k1 = "|".join(self.current_song_key)
-                self.duration_db[k1] = secs
-            save_dur_db(self.duration_db)
+                entries["|".join(self.current_song_key)] = secs
+            self.duration_db.update(entries)
+            set_durations(entries)
 
             # Update Duration cell for visible row of playing song
             for r, s in enumerate(self.current_list):
                 sp = resolve_existing_file(s, migrate=False)
                 if str(sp) == p or (
                     self.current_song_key
-                    and "|".join(s.key()) == "|".join(self.current_song_key)
+                    and s.cache_key == "|".join(self.current_song_key)
                 ):
-                    it = QTableWidgetItem(self._mmss_from_seconds(secs))
-                    it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.table.setItem(r, self.COL_DURATION, it)
+                    self.model.refresh_row(r)
                     break
 
     # --- Duration helpers -------------------------------------------------
@@ -454,32 +463,16 @@ class PlayerQueueMixin:
     def _sec_from_cache_val(self, val) -> Optional[int]:
         """
         Return duration in seconds from mixed cache (seconds or milliseconds).
-        Mirrors your original logic.
+        Thin wrapper over helpers.duration_utils.sec_from_cache_val.
         """
-        try:
-            v = int(val)
-        except Exception:
-            return None
-
-        # If value looks like milliseconds (>= 60,000) and converts to
-        # a plausible length (< 12h), treat as ms→s.
-        if v >= 60_000:
-            v2 = v // 1000
-            if 0 < v2 < 12 * 3600:
-                return v2
-
-        # If already seconds but implausibly huge (>12h), ignore.
-        if v <= 0 or v >= 12 * 3600:
-            return None
-
-        return v
+        return sec_from_cache_val(val)
 
     def _cached_seconds(self, s: Song) -> Optional[int]:
         """
         Return cached seconds for a song, checking both song-key and file-path keys.
         """
         try:
-            k1 = "|".join(s.key())
+            k1 = s.cache_key
             if k1 in self.duration_db:
                 sec = self._sec_from_cache_val(self.duration_db[k1])
                 if sec is not None:
@@ -512,19 +505,22 @@ class PlayerQueueMixin:
         )
 
     def _on_seek_commit(self) -> None:
-        self.player.setPosition(self.seek.value())
+        target = self.seek.value()
+        self.player.setPosition(target)
         self._user_seeking = False
+        self._arm_prefetch_timer(position_ms=target)
 
     # --- Volume -----------------------------------------------------------
 
     def _on_volume_changed(self, value: int) -> None:
         """
         Slider → QAudioOutput volume and label update.
-        Also persisted via _save_state (vol is stored in STATE_DB).
+        Also persisted via _save_state (vol is stored in STATE_DB), once the
+        slider has been still for STATE_SAVE_DEBOUNCE_MS.
         """
         self.audio_output.setVolume(max(0.0, min(1.0, value / 100.0)))
         self.vol_label.setText(f"Vol: {value}%")
-        self._save_state()
+        self._state_save_timer.start()
 
     # ------------------------------------------------------------------
     # Scrolling + row highlight
@@ -559,26 +555,7 @@ class PlayerQueueMixin:
 
         if self.play_context == self._view_identity():
             playing = self.play_queue[self.play_index]
-            row = -1
-            for r in range(self.table.rowCount()):
-                t_item = self.table.item(r, self.COL_TITLE)
-                a_item = self.table.item(r, self.COL_ALBUM)
-                ar_item = self.table.item(r, self.COL_ARTISTS)
-                c_item = self.table.item(r, self.COL_CATEGORY)
-
-                t = t_item.text() if t_item else ""
-                a = a_item.text() if a_item else ""
-                ar = ar_item.text() if ar_item else ""
-                c = c_item.text() if c_item else ""
-
-                if (
-                    t == playing.title
-                    and a == playing.album
-                    and ar == ", ".join(playing.artists)
-                    and c == playing.category
-                ):
-                    row = r
-                    break
+            row = self.model.find_row(playing.key())
 
             if animated and row >= 0:
                 self._animate_scroll_to_row(row)
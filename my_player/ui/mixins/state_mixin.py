@@ -1,10 +1,12 @@
 import json
 from typing import List, Optional, Tuple
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker
 
-from my_player.helpers.constants import STATE_DB, SPECIAL_FAV_CATEGORY, SPECIAL_PL_CATEGORY_PREFIX
+from my_player.helpers.constants import LAST_VIEW_MAX_ROWS, STATE_DB, SPECIAL_FAV_CATEGORY, SPECIAL_PL_CATEGORY_PREFIX
 from my_player.models.song import Song, key_to_dict, dict_to_key
+from my_player.helpers.json_utils import load_json, save_json
+from my_player.helpers.utils import parse_artists
 from my_player.helpers.player_history_utils import save_history, save_custom
 
 
@@ -22,7 +24,12 @@ class StateMixin:
         - self.favourites
         - self.playlists
         - self.current_category
+        - self.current_list
+        - self._shown_view
+        - self._current_scope()
         - self._songs_from_keys()
+        - self._initial_load_task
+        - self.model
     """
 
     def _load_state(self):
@@ -55,9 +62,10 @@ class StateMixin:
             # ignore broken state file
             pass
 
-        # apply UI state (vol_slider + volume handler live on MyPlayerMain)
-        self.vol_slider.setValue(max(0, min(100, vol)))
-        self._on_volume_changed(self.vol_slider.value())
+        # apply UI state (vol_slider + volume handler live on MyPlayerMain);
+        # the handler saves state, so it runs once everything below is restored
+        with QSignalBlocker(self.vol_slider):
+            self.vol_slider.setValue(max(0, min(100, vol)))
 
         # favourites
         try:
@@ -75,6 +83,7 @@ class StateMixin:
             }
         except Exception:
             self.playlists = {}
+        self._sorted_playlist_names = None
 
         # restore last category ONLY if it still exists / is valid
         if (
@@ -85,21 +94,29 @@ class StateMixin:
                 and last_cat.startswith(SPECIAL_PL_CATEGORY_PREFIX)
             )
         ):
-            self.current_category = last_cat
+            self._set_current_category(last_cat)
 
         # reflect sort indicator
         if self.sort_col is not None:
-            self.table.horizontalHeader().setSortIndicator(
-                self.sort_col,
-                Qt.SortOrder.AscendingOrder
-                if self.sort_asc
-                else Qt.SortOrder.DescendingOrder,
-            )
+            hh = self.table.horizontalHeader()
+            with QSignalBlocker(hh):
+                hh.setSortIndicator(
+                    self.sort_col,
+                    Qt.SortOrder.AscendingOrder
+                    if self.sort_asc
+                    else Qt.SortOrder.DescendingOrder,
+                )
+
+        self._on_volume_changed(self.vol_slider.value())
 
     def _save_state(self):
         """
         Save current persistent state to STATE_DB.
+        No-op until the initial load has restored it: the in-memory
+        favourites/playlists/history are still empty and would wipe the files.
         """
+        if self._initial_load_task is not None:
+            return
         vol = int(self.vol_slider.value())
         data = {
             "volume": vol,
@@ -116,15 +133,66 @@ class StateMixin:
             ),
             "sort_col": self.sort_col,
             "sort_asc": self.sort_asc,
+            "last_view": self._last_view_state(),
         }
 
-        STATE_DB.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        save_json(STATE_DB, data)
 
         save_history(self.history)
         save_custom(self.custom_urls)
 
+    def _last_view_state(self) -> Optional[dict]:
+        """
+        The rendered view for the state file: described by what current_list
+        was shown for (saves can run before a newly selected view renders).
+        """
+        if self._shown_view is None:
+            return None
+        cat, scope, query = self._shown_view
+        return {
+            "cat": cat,
+            "scope": scope,
+            "query": query,
+            "keys": [key_to_dict(s.key()) for s in self.current_list[:LAST_VIEW_MAX_ROWS]],
+        }
+
+    def _paint_last_view(self) -> bool:
+        """
+        Put the top rows persisted by the previous run in the table while the
+        library is still loading (startup opens on a blank Category-scope
+        search, so only such a view is reused). Songs are rebuilt from their
+        keys; _on_initial_load() replaces them with the real view.
+        Returns whether anything was painted.
+        """
+        st = load_json(STATE_DB, {})
+        lv = st.get("last_view") if isinstance(st, dict) else None
+        if not isinstance(lv, dict) or lv.get("scope") != self._current_scope() or lv.get("query"):
+            return False
+        try:
+            songs = [
+                Song(c, t, al, parse_artists(ar))
+                for c, t, al, ar in (dict_to_key(x) for x in lv.get("keys", []) if isinstance(x, dict))
+            ]
+        except Exception:
+            return False
+        if not songs:
+            return False
+        self.model.setRows(songs)
+        return True
+
+    def _set_current_category(self, cat: Optional[str]) -> None:
+        """
+        Switch the current view; (kind, name) is parsed here once, so view
+        lookups don't re-check the special prefixes every time.
+        """
+        self.current_category = cat
+        if cat == SPECIAL_FAV_CATEGORY:
+            self._view_kind, self._view_name = "favourites", ""
+        elif cat and cat.startswith(SPECIAL_PL_CATEGORY_PREFIX):
+            self._view_kind, self._view_name = "playlist", cat[len(SPECIAL_PL_CATEGORY_PREFIX):]
+        else:
+            self._view_kind, self._view_name = "category", cat or ""
+
     def _view_identity(self) -> Tuple[str, str]:
         """
         Determine what the current view represents:
@@ -132,25 +200,13 @@ class StateMixin:
         - ("playlist", playlist_name)
         - ("category", category_name)
         """
-        if self.current_category == SPECIAL_FAV_CATEGORY:
-            return "favourites", ""
-        if (
-            self.current_category
-            and self.current_category.startswith(SPECIAL_PL_CATEGORY_PREFIX)
-        ):
-            return (
-                "playlist",
-                self.current_category[len(SPECIAL_PL_CATEGORY_PREFIX) :],
-            )
-        if self.current_category:
-            return "category", self.current_category
-        return "category", ""
+        return self._view_kind, self._view_name
 
     def _base_list_for_current_view(self) -> List[Song]:
         """
         Return base song list depending on current view.
         """
-        kind, name = self._view_identity()
+        kind, name = self._view_kind, self._view_name
 
         if kind == "favourites":
             return self._songs_from_keys(list(self.favourites))
@@ -158,4 +214,4 @@ class StateMixin:
         if kind == "playlist":
             return self._songs_from_keys(self.playlists.get(name, []))
 
-        return self.library.get(self.current_category, [])
+        return self.library.get(name, [])
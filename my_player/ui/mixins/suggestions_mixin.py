@@ -1,3 +1,4 @@
+import heapq
 from typing import List, Tuple
 
 from PyQt6.QtGui import QAction
@@ -19,14 +20,16 @@ class SuggestionsMixin:
         self._songs_from_keys(keys: List[Tuple[str,str,str,str]]) -> List[Song]
         self._set_view_label(text: str) -> None
         self._set_busy(on: bool, text: str = "Working…") -> None
-        self._populate_table_async(songs: List[Song]) -> None
+        self._show_songs(songs: List[Song]) -> None
     """
 
     def _rebuild_suggestions_menu(self) -> None:
         """
-        Rebuild the “Suggestions” menu. Logic same as original.
+        Make sure the “Suggestions” menu has its entry. The menu's content is
+        static, so an already-populated menu is left as is.
         """
-        self.m_suggest.clear()
+        if self.m_suggest.actions():
+            return
         self.m_suggest.addAction(
             QAction("Show Top Suggestions", self, triggered=self._show_suggestions)
         )
@@ -35,15 +38,17 @@ class SuggestionsMixin:
         """
         Show 'Suggestions (Most Played)' view based on self.history["plays"].
         """
-        counts: List[Tuple[int, Tuple[str, str, str, str]]] = []
-        for k, info in self.history.items():
-            counts.append((int(info.get("plays", 0)), tuple(k.split("||"))))
-
-        counts.sort(reverse=True, key=lambda x: x[0])
-        keys = [tuple(x[1]) for x in counts[:500]]
+        # Only the top 500 are shown: partial selection instead of a full sort.
+        # Rank on the raw history items and split keys for the winners only.
+        top = heapq.nlargest(500, self.history.items(), key=self._history_plays)
+        keys: List[Tuple[str, str, str, str]] = [tuple(k.split("||")) for k, _ in top]
         songs = self._songs_from_keys(keys)
 
-        self.current_category = None
+        self._set_current_category(None)
         self._set_view_label("Suggestions (Most Played)")
-        self._set_busy(True, "Rendering results…")
-        self._populate_table_async(songs)
+        self._show_songs(songs)
+
+    @staticmethod
+    def _history_plays(item: Tuple[str, dict]) -> int:
+        """Play count of a (key_str, info) history item."""
+        return int(item[1].get("plays", 0))
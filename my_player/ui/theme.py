@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from textwrap import dedent
 
 class MaterialTheme:
@@ -26,7 +27,9 @@ class MaterialTheme:
     BTN_HOVER     = "#2C3A4E"
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def stylesheet() -> str:
+        # Built once: the palette is constant, and menus/dialogs ask for it on every open
         c = MaterialTheme  # alias for brevity
         return dedent(f"""
             /* ========= Base ========= */
@@ -86,13 +89,16 @@ class MaterialTheme:
             }}
 
             /* ========= Tables ========= */
-            QTableWidget {{
+            QTableView {{
                 gridline-color: {c.BORDER};
                 background: {c.BG_MAIN};
                 color: {c.TEXT};
                 selection-background-color: {c.HOVER};
                 selection-color: {c.TEXT};
             }}
+            QTableView::item {{
+                padding: 6px;
+            }}
             QHeaderView::section {{
                 background: {c.BG_HEADER};
                 color: {c.TEXT};
@@ -111,4 +117,21 @@ class MaterialTheme:
             QProgressBar::chunk {{
                 background-color: {c.SELECTION};
             }}
+
+            /* ========= Main window labels (by objectName) ========= */
+            QLabel#SectionLabel {{
+                font-weight: 600;
+            }}
+            QLabel#PlaylistsSectionLabel {{
+                font-weight: 600;
+                margin-top: 8px;
+            }}
+            QLabel#ViewLabel {{
+                font-weight: 700;
+                font-size: 16px;
+            }}
+            QLabel#NoResultsHint {{
+                color: #98a2b3;
+                font-size: 14px;
+            }}
         """)
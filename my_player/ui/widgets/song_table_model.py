@@ -0,0 +1,177 @@
+from typing import Callable, List, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+from my_player.models.song import Song
+
+
+class SongTableModel(QAbstractTableModel):
+    """
+    Table model over a List[Song] for the main results view.
+
+    Display strings are formatted once per row in setRows() (and on
+    refresh_row / refresh_song), so data() is a plain list lookup and the
+    view only ever asks for the rows inside its viewport. The duration cell
+    may touch the disk on a cache miss, so it is formatted on first paint.
+    """
+
+    HEADERS = ("★", "Category", "Song", "Film/Album", "Artists", "Duration")
+
+    COL_FAV = 0
+    COL_CATEGORY = 1
+    COL_TITLE = 2
+    COL_ALBUM = 3
+    COL_ARTISTS = 4
+    COL_DURATION = 5
+
+    EDITABLE_COLS = (COL_CATEGORY, COL_TITLE, COL_ALBUM, COL_ARTISTS)
+
+    # Case-insensitive sort keys for the plain text columns; the favourite and
+    # duration keys need the owner's state and are built in sort_key()
+    _KEYS = {
+        COL_CATEGORY: lambda s: s.category.lower(),
+        COL_TITLE: lambda s: s.title.lower(),
+        COL_ALBUM: lambda s: s.album.lower(),
+        COL_ARTISTS: lambda s: s.artists_str.lower(),
+    }
+
+    # (row, column, new text) — emitted on inline edit; the owner persists it
+    cellEdited = pyqtSignal(int, int, str)
+
+    def __init__(
+        self,
+        is_fav: Callable[[Song], bool],
+        duration_text: Callable[[Song], str],
+        duration_sec: Callable[[Song], Optional[int]],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._is_fav = is_fav
+        self._duration_text = duration_text
+        self._duration_sec = duration_sec
+        self._rows: List[Song] = []
+        self._display: List[List[Optional[str]]] = []
+
+    # ---------- rows ----------
+
+    def _format(self, s: Song) -> List[Optional[str]]:
+        # Duration (last cell) is filled lazily by data()
+        return ["★" if self._is_fav(s) else "☆", s.category, s.title, s.album, s.artists_str, None]
+
+    def setRows(self, songs: List[Song]) -> None:
+        """Show `songs` (kept by reference, so row r is always songs[r])."""
+        self.beginResetModel()
+        self._rows = songs
+        self._display = [self._format(s) for s in songs]
+        self.endResetModel()
+
+    def rows(self) -> List[Song]:
+        return self._rows
+
+    def song_at(self, row: int) -> Optional[Song]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def find_row(self, key: Tuple[str, str, str, str]) -> int:
+        for r, s in enumerate(self._rows):
+            if s.key() == key:
+                return r
+        return -1
+
+    def refresh_row(self, row: int) -> None:
+        """Re-format one row from its Song (e.g. after a duration/favourite change)."""
+        if not (0 <= row < len(self._rows)):
+            return
+        self._display[row] = self._format(self._rows[row])
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def refresh_song(self, s: Song) -> None:
+        """Re-format every visible row showing `s`."""
+        k = s.key()
+        for r, row_s in enumerate(self._rows):
+            if row_s.key() == k:
+                self.refresh_row(r)
+
+    def sort_key(self, column: int) -> Callable[[Song], object]:
+        """Sort key for `column` (cache-only: never touches the disk)."""
+        if column == self.COL_FAV:
+            is_fav = self._is_fav
+            return lambda s: (not is_fav(s), s.title.lower())
+        if column == self.COL_DURATION:
+            duration_sec = self._duration_sec
+
+            def dur_key(s: Song):
+                sec = duration_sec(s)
+                return float("inf") if sec is None else int(sec)
+
+            return dur_key
+        return self._KEYS.get(column, lambda s: 0)
+
+    # ---------- QAbstractTableModel ----------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        r, c = index.row(), index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            cells = self._display[r]
+            if cells[c] is None:
+                cells[c] = self._duration_text(self._rows[r])
+            return cells[c]
+        if role == Qt.ItemDataRole.TextAlignmentRole and c in (self.COL_FAV, self.COL_DURATION):
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.ToolTipRole and c == self.COL_FAV:
+            return "Toggle favourite"
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+            and 0 <= section < len(self.HEADERS)
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder) -> None:
+        """Sort rows in place (display cache follows) without resetting the view."""
+        if not self._rows:
+            return
+        key = self.sort_key(column)
+        keys = [key(s) for s in self._rows]
+        perm = sorted(
+            range(len(keys)),
+            key=keys.__getitem__,
+            reverse=order == Qt.SortOrder.DescendingOrder,
+        )
+        self.layoutAboutToBeChanged.emit()
+        self._rows[:] = [self._rows[i] for i in perm]
+        self._display = [self._display[i] for i in perm]
+        self.layoutChanged.emit()
+
+    def flags(self, index):
+        f = super().flags(index)
+        if index.isValid() and index.column() in self.EDITABLE_COLS:
+            f |= Qt.ItemFlag.ItemIsEditable
+        return f
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        r, c = index.row(), index.column()
+        if c not in self.EDITABLE_COLS:
+            return False
+        text = "" if value is None else str(value)
+        if text == self._display[r][c]:
+            return False
+        self._display[r][c] = text
+        self.dataChanged.emit(index, index)
+        self.cellEdited.emit(r, c, text)
+        return True
@@ -0,0 +1,70 @@
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from my_player.models.song import Song
+from my_player.services.download import DownloadManager
+
+
+class _RecordingYoutubeDL:
+    sources = []
+
+    def __init__(self, opts):
+        self.opts = opts
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def download(self, urls):
+        type(self).sources.extend(urls)
+        Path(self.opts["outtmpl"]).touch()
+
+
+def _fake_yt_dlp():
+    yt_dlp = types.ModuleType("yt_dlp")
+    utils = types.ModuleType("yt_dlp.utils")
+    utils.match_filter_func = lambda expr: None
+    yt_dlp.YoutubeDL = _RecordingYoutubeDL
+    yt_dlp.utils = utils
+    return {"yt_dlp": yt_dlp, "yt_dlp.utils": utils}
+
+
+class CustomUrlSharingTest(unittest.TestCase):
+    def setUp(self):
+        _RecordingYoutubeDL.sources = []
+
+    def _manager(self, custom_urls):
+        with mock.patch.object(DownloadManager, "_spawn_workers"):
+            return DownloadManager(custom_map=custom_urls, history={})
+
+    def test_url_added_after_construction_is_downloaded(self):
+        custom_urls = {}  # empty at construction, like the main window's before the initial load
+        dm = self._manager(custom_urls)
+        song = Song("Cat", "Title", "Album", ["Artist"])
+        custom_urls["||".join(song.key())] = "https://example.com/watch?v=abc"
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(sys.modules, _fake_yt_dlp()):
+            ok, _ = dm._download_song_file(song, str(Path(tmp) / "out.mp3"))
+
+        self.assertTrue(ok)
+        self.assertEqual(_RecordingYoutubeDL.sources, ["https://example.com/watch?v=abc"])
+
+    def test_without_custom_url_falls_back_to_search(self):
+        dm = self._manager({})
+        song = Song("Cat", "Title", "Album", ["Artist"])
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(sys.modules, _fake_yt_dlp()):
+            dm._download_song_file(song, str(Path(tmp) / "out.mp3"))
+
+        self.assertEqual(len(_RecordingYoutubeDL.sources), 1)
+        self.assertTrue(_RecordingYoutubeDL.sources[0].startswith("ytsearch1:Title"))
+
+
+if __name__ == "__main__":
+    unittest.main()